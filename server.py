@@ -2,9 +2,12 @@
 """
 Bumi API Server Entry Point for Render deployment.
 Run with: uvicorn server:app --host 0.0.0.0 --port 8000
+
+Spawns WEB_CONCURRENCY worker processes (default: one per CPU core). Each worker
+has its own event loop and browser pool, so pool sizes apply per worker.
 """
 
-from src.api import create_api_server
+from src.api import create_api_server, uvicorn_performance_options
 
 app = create_api_server()
 
@@ -13,4 +16,12 @@ if __name__ == "__main__":
     import os
 
     port = int(os.environ.get("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    workers = int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
+    # workers > 1 requires an import string rather than the app object
+    uvicorn.run(
+        "server:app",
+        host="0.0.0.0",
+        port=port,
+        workers=workers,
+        **uvicorn_performance_options(),
+    )
@@ -37,8 +37,10 @@ from .cache import (
     cache_set,
     cache_clear,
     cache_clear_expired,
+    CACHE_MAX_AGE,
     CACHE_DIR,
     DEFAULT_TTL,
+    MemoryCache,
 )
 
 from .progress import (
@@ -53,17 +55,45 @@ from .config import (
     apply_timeouts_to_page,
     safe_goto,
     safe_wait_for_selector,
+    PAGE_LOAD_STATE,
 )
 
 from .browser import (
     BrowserPool,
     get_browser_pool,
     close_browser_pool,
+    close_idle_browser_pool,
+    wait_result,
+    BrowserExecutor,
+    MAX_BROWSER_POOLS,
+    scrape_page,
+    scrape_many,
+    block_resources,
+    disable_playwright_stack_capture,
+    launch_browser,
+    BLOCKED_RESOURCE_TYPES,
     RateLimiter,
     set_rate_limit,
     rate_limit_wait,
+    rate_limit_wait_async,
     retry_with_backoff,
+    retry_with_backoff_async,
     make_request_with_retry,
+    is_transient_error,
+    set_host_concurrency,
+    get_host_queue_depth,
+    host_slot,
+)
+
+from .fetcher import (
+    fetch_html,
+    fetch_documents,
+    iter_documents,
+    extract_items,
+    page_loader,
+    http_fetch_available,
+    get_http_client,
+    close_http_client,
 )
 
 from .parsers import (
@@ -98,6 +128,7 @@ from .snapshot import (
 
 from .scrapers import (
     scrape_film_details,
+    scrape_film_details_batch,
     scrape_user_reviews,
     scrape_user_diary,
     scrape_user_lists,
@@ -108,6 +139,14 @@ from .scrapers import (
     scrape_letterboxd_user_films,
     scrape_letterboxd_user,
     scrape_letterboxd,
+    iter_user_reviews,
+    iter_user_diary,
+    iter_letterboxd_user_watchlist,
+    iter_letterboxd_user_films,
+    iter_user_lists,
+    iter_list_contents,
+    iter_user_followers,
+    iter_user_following,
 )
 
 from .api import (
@@ -126,6 +165,7 @@ from .webhooks import (
 
 from .search import (
     search_films,
+    search_films_batch,
     search_films_advanced,
     get_popular_films,
     scrape_activity_feed,
@@ -169,8 +209,10 @@ __all__ = [
     "cache_set",
     "cache_clear",
     "cache_clear_expired",
+    "CACHE_MAX_AGE",
     "CACHE_DIR",
     "DEFAULT_TTL",
+    "MemoryCache",
     # Progress
     "ProgressTracker",
     "create_progress_bar_callback",
@@ -181,15 +223,41 @@ __all__ = [
     "apply_timeouts_to_page",
     "safe_goto",
     "safe_wait_for_selector",
+    "PAGE_LOAD_STATE",
     # Browser
     "BrowserPool",
     "get_browser_pool",
     "close_browser_pool",
+    "close_idle_browser_pool",
+    "wait_result",
+    "BrowserExecutor",
+    "MAX_BROWSER_POOLS",
+    "scrape_page",
+    "scrape_many",
+    "block_resources",
+    "disable_playwright_stack_capture",
+    "launch_browser",
+    "BLOCKED_RESOURCE_TYPES",
     "RateLimiter",
     "set_rate_limit",
     "rate_limit_wait",
+    "rate_limit_wait_async",
     "retry_with_backoff",
+    "retry_with_backoff_async",
     "make_request_with_retry",
+    "is_transient_error",
+    "set_host_concurrency",
+    "get_host_queue_depth",
+    "host_slot",
+    # Fetcher
+    "fetch_html",
+    "fetch_documents",
+    "iter_documents",
+    "extract_items",
+    "page_loader",
+    "http_fetch_available",
+    "get_http_client",
+    "close_http_client",
     # Parsers
     "parse_statistic_value",
     "parse_user_statistics",
@@ -214,6 +282,7 @@ __all__ = [
     "load_latest_snapshot",
     # Scrapers
     "scrape_film_details",
+    "scrape_film_details_batch",
     "scrape_user_reviews",
     "scrape_user_diary",
     "scrape_user_lists",
@@ -224,6 +293,14 @@ __all__ = [
     "scrape_letterboxd_user_films",
     "scrape_letterboxd_user",
     "scrape_letterboxd",
+    "iter_user_reviews",
+    "iter_user_diary",
+    "iter_letterboxd_user_watchlist",
+    "iter_letterboxd_user_films",
+    "iter_user_lists",
+    "iter_list_contents",
+    "iter_user_followers",
+    "iter_user_following",
     # API
     "create_api_server",
     "run_api_server",
@@ -236,6 +313,7 @@ __all__ = [
     "scrape_with_webhook",
     # Search
     "search_films",
+    "search_films_batch",
     "search_films_advanced",
     "get_popular_films",
     "scrape_activity_feed",
@@ -1,6 +1,15 @@
 # ----- FASTAPI SERVER -----
 
-from .validation import validate_username
+import os
+import sys
+import uuid
+import hashlib
+import asyncio
+import threading
+import functools
+from contextlib import asynccontextmanager
+
+from .validation import validate_username, LETTERBOXD_USERNAME_PATTERN, LETTERBOXD_DOMAIN
 from .exceptions import BumiException
 from .scrapers import (
     scrape_letterboxd,
@@ -8,48 +17,233 @@ from .scrapers import (
     scrape_user_diary,
     scrape_user_reviews,
     scrape_film_details,
+    close_section_executor,
 )
 from .snapshot import batch_scrape_users
 from .validation import check_profile_exists
+from .cache import MemoryCache, cache_get, cache_set, cache_clear_expired, CACHE_MAX_AGE
+from .browser import get_host_queue_depth, BrowserExecutor
+from .fetcher import close_http_client
 
+DEFAULT_THREADPOOL_SIZE = 32
 
-def create_api_server():
+
+@functools.lru_cache(maxsize=4096)
+def _profile_url(username):
+    """returns the profile URL for an already validated username"""
+    return f"https://{LETTERBOXD_DOMAIN}/{username}/"
+
+
+def is_production():
+    """returns True when BUMI_ENV is set to production"""
+    return os.environ.get("BUMI_ENV", "").lower() == "production"
+
+
+# response cache lifetimes in seconds, per kind of scraped data
+USER_CACHE_TTL = 3600
+WATCHLIST_CACHE_TTL = 6 * 3600
+ACTIVITY_CACHE_TTL = 3600
+FILM_CACHE_TTL = 24 * 3600
+
+
+# scrapers report failures (rate limits, timeouts) as None, empty lists or blank
+# records, so only results passing these checks are cached
+def _has_profile(result):
+    """returns True when a scrape_letterboxd result holds a profile"""
+    return bool(result and result.get("scraped_data"))
+
+
+def _has_title(result):
+    """returns True when a scrape_film_details result found the film"""
+    return bool(result and result.get("title"))
+
+
+# batch job bookkeeping: finished jobs are kept for JOB_RESULT_TTL seconds in a
+# store of at most JOB_STORE_SIZE entries, and new batches are refused with a 503
+# once MAX_PENDING_JOBS are still running
+JOB_STORE_SIZE = 10_000
+JOB_RESULT_TTL = 3600
+MAX_PENDING_JOBS = 100
+JOB_RETRY_AFTER = 30
+
+# HTTP Cache-Control max-age in seconds for GET responses, per endpoint group
+USER_MAX_AGE = 300
+FILM_MAX_AGE = 3600
+CHECK_MAX_AGE = 60
+
+
+def create_api_server(threadpool_size=DEFAULT_THREADPOOL_SIZE):
     """
     creates a FastAPI server exposing scraping functionality
 
+    Args:
+        threadpool_size: number of worker threads for blocking scrape calls
+
     Returns:
         FastAPI app instance
 
     Requires:
-        pip install fastapi uvicorn
+        pip install fastapi uvicorn orjson
     """
     try:
-        from fastapi import FastAPI, HTTPException, BackgroundTasks
-        from fastapi.responses import JSONResponse
-        from pydantic import BaseModel
-        from typing import Optional, List
+        import orjson
+        from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, Response
+        from fastapi.middleware.gzip import GZipMiddleware
+        from fastapi.responses import ORJSONResponse, PlainTextResponse
+        from pydantic import BaseModel, StringConstraints
+        from typing import List, Annotated
     except ImportError:
-        raise ImportError("FastAPI required: pip install fastapi uvicorn")
+        raise ImportError("FastAPI required: pip install fastapi uvicorn orjson")
+
+    # scrapers use the sync playwright API, which blocks and refuses to run on the
+    # event loop thread, so every scrape is offloaded to this pool
+    executor = BrowserExecutor(max_workers=threadpool_size, thread_name_prefix="bumi-scrape")
+
+    @asynccontextmanager
+    async def lifespan(app):
+        # the disk cache is also swept as it is written, see cache_set
+        await asyncio.get_running_loop().run_in_executor(
+            executor, cache_clear_expired, CACHE_MAX_AGE
+        )
+        yield
+        # workers close their browser pools as they exit
+        executor.shutdown(wait=True, cancel_futures=True)
+        close_section_executor()
+        close_http_client()
+
+    # production skips the interactive docs and OpenAPI schema routes
+    docs_options = (
+        {"docs_url": None, "redoc_url": None, "openapi_url": None} if is_production() else {}
+    )
 
     app = FastAPI(
         title="Bumi API",
         description="Letterboxd profile scraper API",
         version="1.0.0",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+        **docs_options,
     )
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+    async def run_blocking(func, *args, **kwargs):
+        """runs a blocking scrape function on the worker threadpool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+    # two-tier response cache: in-process LRU in front of the shared on-disk cache
+    memory_cache = MemoryCache(maxsize=1024)
+    # per-key lock and the number of requests holding or waiting on it; an entry
+    # is dropped only when that count reaches zero, so queued waiters keep their lock
+    key_locks = {}
+    key_lock_users = {}
+
+    async def cached_scrape(cache_key, ttl, func, *args, success=bool, **kwargs):
+        """
+        returns a cached scrape result, running func on a miss
+
+        Only one request per key runs the scrape; concurrent requests for the
+        same key wait for it and are then served from the cache. Results for
+        which success(result) is false are returned but not cached; the default
+        treats None and empty lists as failed scrapes.
+
+        Returns:
+            tuple of (result, "HIT" or "MISS")
+        """
+        result = memory_cache.get(cache_key)
+        if result is not None:
+            return result, "HIT"
+
+        lock = key_locks.setdefault(cache_key, asyncio.Lock())
+        key_lock_users[cache_key] = key_lock_users.get(cache_key, 0) + 1
+        try:
+            async with lock:
+                result = memory_cache.get(cache_key)
+                if result is None:
+                    result = await run_blocking(cache_get, cache_key, ttl)
+                if success(result):
+                    memory_cache.set(cache_key, result, ttl)
+                    return result, "HIT"
+
+                result = await run_blocking(func, *args, **kwargs)
+                if success(result):
+                    memory_cache.set(cache_key, result, ttl)
+                    await run_blocking(cache_set, cache_key, result)
+                return result, "MISS"
+        finally:
+            key_lock_users[cache_key] -= 1
+            if not key_lock_users[cache_key]:
+                del key_lock_users[cache_key]
+                del key_locks[cache_key]
+
+    def cacheable_response(request, content, max_age, cache_status=None, cacheable=True):
+        """
+        returns content as JSON with Cache-Control and ETag headers, or an empty
+        304 response when the client's If-None-Match already holds that ETag
+
+        Pass cacheable=False for failed scrapes: they are sent with no-store and
+        no ETag, so browsers and CDNs do not keep them either.
+        """
+        body = orjson.dumps(content)
+        if not cacheable:
+            headers = {"Cache-Control": "no-store"}
+            if cache_status:
+                headers["X-Cache"] = cache_status
+            return Response(content=body, media_type="application/json", headers=headers)
+
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        headers = {
+            "Cache-Control": f"public, max-age={max_age}, stale-while-revalidate=60",
+            "ETag": etag,
+        }
+        if cache_status:
+            headers["X-Cache"] = cache_status
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            client_etags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            if etag in client_etags or "*" in client_etags:
+                return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    # same rules as validate_username, enforced once by FastAPI for bodies and paths
+    Username = Annotated[
+        str,
+        StringConstraints(
+            strip_whitespace=True,
+            min_length=2,
+            max_length=30,
+            pattern=LETTERBOXD_USERNAME_PATTERN.pattern,
+        ),
+    ]
 
     class ScrapeRequest(BaseModel):
-        username: str
-        paginate: Optional[bool] = True
+        username: Username
+        paginate: bool = True
 
     class BatchScrapeRequest(BaseModel):
-        usernames: List[str]
-        paginate: Optional[bool] = True
+        usernames: List[Username]
+        paginate: bool = True
 
     class FilmRequest(BaseModel):
         film_slug: str
 
-    # store for async job results
-    _job_results = {}
+    # bounded store for async job results, oldest jobs are dropped when full
+    _job_results = MemoryCache(maxsize=JOB_STORE_SIZE, ttl=JOB_RESULT_TTL)
+    job_counters = {"pending": 0, "rejected": 0}
+    job_lock = threading.Lock()
+
+    def run_batch_job(job_id, usernames):
+        """runs a batch scrape and records its outcome under job_id"""
+        try:
+            _job_results.set(
+                job_id, {"status": "complete", "result": batch_scrape_users(usernames)}
+            )
+        except Exception as e:
+            _job_results.set(job_id, {"status": "failed", "error": str(e)})
+        finally:
+            with job_lock:
+                job_counters["pending"] -= 1
 
     @app.get("/")
     async def root():
@@ -63,101 +257,159 @@ def create_api_server():
     async def scrape_user_endpoint(request: ScrapeRequest):
         """scrapes a single user profile"""
         try:
-            validation = validate_username(request.username)
-            if not validation["valid"]:
-                raise HTTPException(status_code=400, detail=validation["error"])
-
-            target_url = f"https://letterboxd.com/{request.username}/"
-            result = scrape_letterboxd(target_url, paginate=request.paginate)
-            return JSONResponse(content=result)
+            target_url = _profile_url(request.username)
+            result, cache_status = await cached_scrape(
+                f"v1:bumi:user:{request.username}:p{int(request.paginate)}",
+                USER_CACHE_TTL,
+                scrape_letterboxd,
+                target_url,
+                paginate=request.paginate,
+                success=_has_profile,
+            )
+            return ORJSONResponse(content=result, headers={"X-Cache": cache_status})
         except BumiException as e:
             raise HTTPException(status_code=500, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Scraping failed: {e}")
 
-    @app.post("/scrape/batch")
-    async def scrape_batch_endpoint(
-        request: BatchScrapeRequest, background_tasks: BackgroundTasks
-    ):
-        """scrapes multiple user profiles"""
-        try:
-            for username in request.usernames:
-                validation = validate_username(username)
-                if not validation["valid"]:
-                    raise HTTPException(
-                        status_code=400, detail=f"Invalid username: {username}"
-                    )
-
-            result = batch_scrape_users(request.usernames)
-            return JSONResponse(content=result)
-        except BumiException as e:
-            raise HTTPException(status_code=500, detail=str(e))
+    @app.post("/scrape/batch", status_code=202)
+    async def scrape_batch_endpoint(request: BatchScrapeRequest, background_tasks: BackgroundTasks):
+        """queues a batch scrape of multiple user profiles and returns its job id"""
+        with job_lock:
+            if job_counters["pending"] >= MAX_PENDING_JOBS:
+                job_counters["rejected"] += 1
+                raise HTTPException(
+                    status_code=503,
+                    detail="Too many batch jobs in progress",
+                    headers={"Retry-After": str(JOB_RETRY_AFTER)},
+                )
+            job_counters["pending"] += 1
+
+        job_id = f"job_{uuid.uuid4().hex}"
+        _job_results.set(job_id, {"status": "pending"})
+        background_tasks.add_task(run_blocking, run_batch_job, job_id, request.usernames)
+        return ORJSONResponse(content={"job_id": job_id, "status": "pending"}, status_code=202)
+
+    @app.get("/jobs/{job_id}")
+    async def job_status_endpoint(job_id: str):
+        """returns the status and result of a queued batch scrape"""
+        job = _job_results.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+        return ORJSONResponse(content={"job_id": job_id, **job})
+
+    @app.get("/metrics")
+    async def metrics_endpoint():
+        """exposes job queue and per-host request queue metrics in Prometheus format"""
+        with job_lock:
+            pending = job_counters["pending"]
+            rejected = job_counters["rejected"]
+        lines = [
+            "# TYPE bumi_jobs_pending gauge",
+            f"bumi_jobs_pending {pending}",
+            "# TYPE bumi_jobs_stored gauge",
+            f"bumi_jobs_stored {len(_job_results)}",
+            "# TYPE bumi_jobs_dropped_total counter",
+            f"bumi_jobs_dropped_total {_job_results.evictions}",
+            "# TYPE bumi_jobs_rejected_total counter",
+            f"bumi_jobs_rejected_total {rejected}",
+            "# TYPE bumi_host_queue_depth gauge",
+        ]
+        for host, waiting in sorted(get_host_queue_depth().items()):
+            lines.append(f'bumi_host_queue_depth{{host="{host}"}} {waiting}')
+        return PlainTextResponse("\n".join(lines) + "\n", media_type="text/plain; version=0.0.4")
 
     @app.get("/scrape/user/{username}")
-    async def scrape_user_get(username: str, paginate: bool = True):
+    async def scrape_user_get(request: Request, username: Username, paginate: bool = True):
         """scrapes a user profile via GET"""
         try:
-            validation = validate_username(username)
-            if not validation["valid"]:
-                raise HTTPException(status_code=400, detail=validation["error"])
-
-            target_url = f"https://letterboxd.com/{username}/"
-            result = scrape_letterboxd(target_url, paginate=paginate)
-            return JSONResponse(content=result)
+            target_url = _profile_url(username)
+            result, cache_status = await cached_scrape(
+                f"v1:bumi:user:{username}:p{int(paginate)}",
+                USER_CACHE_TTL,
+                scrape_letterboxd,
+                target_url,
+                paginate=paginate,
+                success=_has_profile,
+            )
+            return cacheable_response(
+                request, result, USER_MAX_AGE, cache_status, cacheable=_has_profile(result)
+            )
         except BumiException as e:
             raise HTTPException(status_code=500, detail=str(e))
 
     @app.get("/scrape/watchlist/{username}")
     async def scrape_watchlist_endpoint(
-        username: str, paginate: bool = True, max_pages: int = 50
+        request: Request, username: Username, paginate: bool = True, max_pages: int = 50
     ):
         """scrapes a user's watchlist"""
         try:
-            validation = validate_username(username)
-            if not validation["valid"]:
-                raise HTTPException(status_code=400, detail=validation["error"])
-
-            target_url = f"https://letterboxd.com/{username}/"
-            result = scrape_letterboxd_user_watchlist(
-                target_url, paginate=paginate, max_pages=max_pages
+            target_url = _profile_url(username)
+            result, cache_status = await cached_scrape(
+                f"v1:bumi:user:{username}:watchlist:p{int(paginate)}:m{max_pages}",
+                WATCHLIST_CACHE_TTL,
+                scrape_letterboxd_user_watchlist,
+                target_url,
+                paginate=paginate,
+                max_pages=max_pages,
+            )
+            return cacheable_response(
+                request,
+                {"username": username, "watchlist": result},
+                USER_MAX_AGE,
+                cache_status,
+                cacheable=bool(result),
             )
-            return JSONResponse(content={"username": username, "watchlist": result})
         except BumiException as e:
             raise HTTPException(status_code=500, detail=str(e))
 
     @app.get("/scrape/diary/{username}")
     async def scrape_diary_endpoint(
-        username: str, paginate: bool = True, max_pages: int = 50
+        request: Request, username: Username, paginate: bool = True, max_pages: int = 50
     ):
         """scrapes a user's diary"""
         try:
-            validation = validate_username(username)
-            if not validation["valid"]:
-                raise HTTPException(status_code=400, detail=validation["error"])
-
-            target_url = f"https://letterboxd.com/{username}/"
-            result = scrape_user_diary(
-                target_url, paginate=paginate, max_pages=max_pages
+            target_url = _profile_url(username)
+            result, cache_status = await cached_scrape(
+                f"v1:bumi:user:{username}:diary:p{int(paginate)}:m{max_pages}",
+                ACTIVITY_CACHE_TTL,
+                scrape_user_diary,
+                target_url,
+                paginate=paginate,
+                max_pages=max_pages,
+            )
+            return cacheable_response(
+                request,
+                {"username": username, "diary": result},
+                USER_MAX_AGE,
+                cache_status,
+                cacheable=bool(result),
             )
-            return JSONResponse(content={"username": username, "diary": result})
         except BumiException as e:
             raise HTTPException(status_code=500, detail=str(e))
 
     @app.get("/scrape/reviews/{username}")
     async def scrape_reviews_endpoint(
-        username: str, paginate: bool = True, max_pages: int = 50
+        request: Request, username: Username, paginate: bool = True, max_pages: int = 50
     ):
         """scrapes a user's reviews"""
         try:
-            validation = validate_username(username)
-            if not validation["valid"]:
-                raise HTTPException(status_code=400, detail=validation["error"])
-
-            target_url = f"https://letterboxd.com/{username}/"
-            result = scrape_user_reviews(
-                target_url, paginate=paginate, max_pages=max_pages
+            target_url = _profile_url(username)
+            result, cache_status = await cached_scrape(
+                f"v1:bumi:user:{username}:reviews:p{int(paginate)}:m{max_pages}",
+                ACTIVITY_CACHE_TTL,
+                scrape_user_reviews,
+                target_url,
+                paginate=paginate,
+                max_pages=max_pages,
+            )
+            return cacheable_response(
+                request,
+                {"username": username, "reviews": result},
+                USER_MAX_AGE,
+                cache_status,
+                cacheable=bool(result),
             )
-            return JSONResponse(content={"username": username, "reviews": result})
         except BumiException as e:
             raise HTTPException(status_code=500, detail=str(e))
 
@@ -165,48 +417,89 @@ def create_api_server():
     async def scrape_film_endpoint(request: FilmRequest):
         """scrapes film details"""
         try:
-            result = scrape_film_details(request.film_slug)
-            return JSONResponse(content=result)
+            result, cache_status = await cached_scrape(
+                f"v1:bumi:film:{request.film_slug}",
+                FILM_CACHE_TTL,
+                scrape_film_details,
+                request.film_slug,
+                success=_has_title,
+            )
+            return ORJSONResponse(content=result, headers={"X-Cache": cache_status})
         except BumiException as e:
             raise HTTPException(status_code=500, detail=str(e))
 
     @app.get("/scrape/film/{film_slug}")
-    async def scrape_film_get(film_slug: str):
+    async def scrape_film_get(request: Request, film_slug: str):
         """scrapes film details via GET"""
         try:
-            result = scrape_film_details(film_slug)
-            return JSONResponse(content=result)
+            result, cache_status = await cached_scrape(
+                f"v1:bumi:film:{film_slug}",
+                FILM_CACHE_TTL,
+                scrape_film_details,
+                film_slug,
+                success=_has_title,
+            )
+            return cacheable_response(
+                request, result, FILM_MAX_AGE, cache_status, cacheable=_has_title(result)
+            )
         except BumiException as e:
             raise HTTPException(status_code=500, detail=str(e))
 
     @app.get("/validate/{username}")
-    async def validate_endpoint(username: str):
+    async def validate_endpoint(request: Request, username: str):
         """validates a username"""
         result = validate_username(username)
-        return JSONResponse(content=result)
+        return cacheable_response(request, result, CHECK_MAX_AGE)
 
     @app.get("/check/{username}")
-    async def check_profile_endpoint(username: str):
+    async def check_profile_endpoint(request: Request, username: Username):
         """checks if a profile exists"""
-        target_url = f"https://letterboxd.com/{username}/"
-        result = check_profile_exists(target_url)
-        return JSONResponse(content=result)
+        target_url = _profile_url(username)
+        result = await run_blocking(check_profile_exists, target_url)
+        return cacheable_response(request, result, CHECK_MAX_AGE)
 
     return app
 
 
-def run_api_server(host="0.0.0.0", port=8000):
+def run_api_server(host="0.0.0.0", port=8000, workers=1):
     """
     runs the FastAPI server
 
     Args:
         host: host to bind to
         port: port to listen on
+        workers: number of worker processes, each with its own event loop and browser pool
     """
     try:
         import uvicorn
     except ImportError:
         raise ImportError("uvicorn required: pip install uvicorn")
 
-    app = create_api_server()
-    uvicorn.run(app, host=host, port=port)
+    if workers > 1:
+        # worker processes build their own app, so uvicorn needs an import string
+        uvicorn.run(
+            f"{__name__}:create_api_server",
+            factory=True,
+            host=host,
+            port=port,
+            workers=workers,
+            **uvicorn_performance_options(),
+        )
+    else:
+        app = create_api_server()
+        uvicorn.run(app, host=host, port=port, **uvicorn_performance_options())
+
+
+def uvicorn_performance_options():
+    """
+    returns uvicorn settings for the fastest available event loop and HTTP parser
+
+    Returns:
+        dict of keyword arguments for uvicorn.run / uvicorn.Config
+    """
+    # uvloop has no Windows support, so fall back to the stock asyncio loop there
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+    options = {"loop": loop, "http": "httptools", "access_log": False}
+    if is_production():
+        options["log_level"] = "warning"
+    return options
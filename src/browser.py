@@ -1,12 +1,145 @@
 # ----- BROWSER POOL & RATE LIMITING -----
 
+import os
 import time
+import atexit
+import asyncio
+import inspect
+import queue
 import random
+import threading
+import traceback
+import email.utils
+import urllib.parse
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+
+from .config import PAGE_LOAD_STATE, USER_AGENT, ACCEPT_LANGUAGE
+from .exceptions import RateLimitedError, NetworkError
+from .exceptions import TimeoutError as ScrapeTimeoutError
+
+# request types that scraping never needs; text is read from the DOM without
+# layout (see nodeText in fetcher._EXTRACT_JS), so stylesheets are not needed either
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+# third-party trackers and ad networks embedded in letterboxd pages
+BLOCKED_URL_PATTERNS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "adservice.google.com",
+    "quantserve.com",
+    "scorecardresearch.com",
+)
+
+
+# options for every scraping context, set once when the context is created
+CONTEXT_OPTIONS = {
+    "service_workers": "block",
+    "user_agent": USER_AGENT,
+    "viewport": {"width": 800, "height": 600},
+    "extra_http_headers": {"Accept-Language": ACCEPT_LANGUAGE},
+}
+
+
+def _abort_blocked_resources(route):
+    """aborts requests for blocked resource types and trackers, continues the rest"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        pattern in request.url for pattern in BLOCKED_URL_PATTERNS
+    ):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def block_resources(target):
+    """
+    stops a playwright page or browser context from downloading images, media,
+    fonts, and tracking scripts
+
+    Args:
+        target: playwright page or browser context
+    """
+    target.route("**/*", _abort_blocked_resources)
+
+
+class _NoStackInspect:
+    """inspect module stand-in whose stack() skips collecting frames"""
+
+    def __getattr__(self, name):
+        return getattr(inspect, name)
+
+    @staticmethod
+    def stack(context=1):
+        return []
+
+
+class _NoStackTraceback:
+    """traceback module stand-in whose extract_stack() skips collecting frames"""
+
+    def __getattr__(self, name):
+        return getattr(traceback, name)
+
+    @staticmethod
+    def extract_stack(f=None, limit=None):
+        return []
+
+
+def disable_playwright_stack_capture():
+    """
+    stops playwright-python from walking the Python stack on every API call
+
+    Every sync call runs inspect.stack() and traceback.extract_stack() in
+    playwright's _sync_base, and _connection falls back to both when they are
+    missing. Playwright only uses those frames for error and tracing metadata,
+    but collecting them is a large share of CPU in selector-heavy scraping. Only
+    those two playwright modules are patched; inspect and traceback themselves
+    are untouched. Applied on import when BUMI_PW_NO_STACK=1.
+
+    Returns:
+        True if playwright was patched, False if it is not installed
+    """
+    try:
+        from playwright._impl import _connection, _sync_base
+    except ImportError:
+        return False
+    for module in (_connection, _sync_base):
+        module.inspect = _NoStackInspect()
+        module.traceback = _NoStackTraceback()
+    return True
+
+
+if os.environ.get("BUMI_PW_NO_STACK") == "1":
+    disable_playwright_stack_capture()
+
+
+def launch_browser(playwright, headless=True):
+    """
+    launches chromium, or connects to an already running one when BUMI_CDP_URL is set
+
+    BUMI_CDP_URL is a chromium DevTools endpoint (e.g. http://localhost:9222 from
+    chromium --remote-debugging-port=9222); every process and thread then shares that
+    browser instead of starting its own. Closing a connected browser only disconnects.
+
+    Args:
+        playwright: running sync playwright instance
+        headless: whether a launched browser runs in headless mode
+    """
+    cdp_url = os.environ.get("BUMI_CDP_URL")
+    if cdp_url:
+        return playwright.chromium.connect_over_cdp(cdp_url)
+    return playwright.chromium.launch(headless=headless)
 
 
 class BrowserPool:
     """
     manages a pool of browser instances for concurrent scraping
+
+    Each browser also keeps one warm browser context, so callers that only need
+    a fresh page can skip both browser launch and context creation.
     """
 
     def __init__(self, pool_size=3, headless=True):
@@ -19,8 +152,16 @@ class BrowserPool:
         self.headless = headless
         self._playwright = None
         self._browsers = []
-        self._available = []
+        self._available = queue.Queue()
+        self._contexts = queue.Queue()
         self._in_use = set()
+        self._contexts_in_use = set()
+        self._lock = threading.Lock()
+        # bookkeeping for the process-wide pool limit, see get_browser_pool
+        self.uses = 0
+        self.last_used = time.monotonic()
+        self.reclaim_requested = False
+        self.holds_slot = False
 
     def start(self):
         """initializes the browser pool"""
@@ -28,24 +169,71 @@ class BrowserPool:
 
         self._playwright = sync_playwright().start()
         for _ in range(self.pool_size):
-            browser = self._playwright.chromium.launch(headless=self.headless)
+            browser = launch_browser(self._playwright, self.headless)
             self._browsers.append(browser)
-            self._available.append(browser)
+            self._available.put_nowait(browser)
+            context = browser.new_context(**CONTEXT_OPTIONS)
+            block_resources(context)
+            self._contexts.put_nowait(context)
         print(f"Browser pool started with {self.pool_size} instances")
 
-    def acquire(self):
-        """acquires a browser from the pool, blocks if none available"""
-        while not self._available:
-            time.sleep(0.1)
-        browser = self._available.pop()
-        self._in_use.add(browser)
+    def acquire(self, timeout=None):
+        """
+        acquires a browser from the pool, blocks until one is released
+
+        Args:
+            timeout: maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            browser instance, or None if the timeout expired
+        """
+        try:
+            browser = self._available.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        with self._lock:
+            self._in_use.add(browser)
         return browser
 
     def release(self, browser):
         """returns a browser to the pool"""
-        if browser in self._in_use:
+        with self._lock:
+            if browser not in self._in_use:
+                return
             self._in_use.remove(browser)
-            self._available.append(browser)
+        self._available.put_nowait(browser)
+
+    def acquire_context(self, timeout=None):
+        """
+        acquires a warm browser context from the pool, blocks until one is released
+
+        Args:
+            timeout: maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            browser context, or None if the timeout expired
+        """
+        try:
+            context = self._contexts.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        with self._lock:
+            self._contexts_in_use.add(context)
+        return context
+
+    def release_context(self, context):
+        """closes the context's pages, clears its cookies, and returns it to the pool"""
+        with self._lock:
+            if context not in self._contexts_in_use:
+                return
+            self._contexts_in_use.remove(context)
+        try:
+            for page in context.pages:
+                page.close()
+            context.clear_cookies()
+        except Exception:
+            pass
+        self._contexts.put_nowait(context)
 
     def close(self):
         """closes all browsers and playwright"""
@@ -57,8 +245,11 @@ class BrowserPool:
         if self._playwright:
             self._playwright.stop()
         self._browsers.clear()
-        self._available.clear()
-        self._in_use.clear()
+        self._available = queue.Queue()
+        self._contexts = queue.Queue()
+        with self._lock:
+            self._in_use.clear()
+            self._contexts_in_use.clear()
         print("Browser pool closed")
 
     def __enter__(self):
@@ -70,25 +261,332 @@ class BrowserPool:
         return False
 
 
-# global browser pool instance (initialized on demand)
-_browser_pool = None
+# browser pools are kept per thread: playwright's sync API objects can only be
+# used from the thread that created them
+_thread_state = threading.local()
+
+# at most this many browser pools are open at once across all threads; a thread
+# that needs one while none is free asks the least recently used idle pool's
+# thread to close it (see _acquire_pool_slot)
+MAX_BROWSER_POOLS = int(os.environ.get("BUMI_MAX_BROWSER_POOLS", 4))
+_pool_slots = threading.BoundedSemaphore(MAX_BROWSER_POOLS)
+
+# pools stay warm between scrapes; idle threads of a BrowserExecutor close theirs
+# after BROWSER_POOL_IDLE_TIMEOUT seconds, and a pool is relaunched after
+# BROWSER_POOL_MAX_USES pages to bound chromium's memory growth
+BROWSER_POOL_IDLE_TIMEOUT = 60
+BROWSER_POOL_MAX_USES = 500
+
+# how often waiting threads look for an idle pool to reclaim, and how long a
+# thread waits for a slot before launching a browser over the limit (seconds)
+POOL_RECLAIM_INTERVAL = 0.5
+POOL_SLOT_TIMEOUT = 60
+
+# every open pool -> its owning thread, so waiters can find idle pools
+_open_pools = {}
+_open_pools_lock = threading.Lock()
+
+
+def _acquire_pool_slot():
+    """
+    waits for a free pool slot, asking idle pools to close meanwhile
+
+    Returns:
+        True if a slot was taken, False if POOL_SLOT_TIMEOUT expired first
+    """
+    deadline = time.monotonic() + POOL_SLOT_TIMEOUT
+    while not _pool_slots.acquire(timeout=POOL_RECLAIM_INTERVAL):
+        _reclaim_idle_pool()
+        if time.monotonic() >= deadline:
+            return False
+    return True
+
+
+def _reclaim_idle_pool():
+    """
+    asks the thread of the least recently used idle pool to close it
+
+    Playwright objects can only be closed from their own thread, so the pool is
+    only flagged here; its thread closes it at its next page, poll or wait (see
+    close_idle_browser_pool). Pools of threads that have exited give back their
+    slot right away.
+    """
+    with _open_pools_lock:
+        for pool, owner in list(_open_pools.items()):
+            if not owner.is_alive():
+                del _open_pools[pool]
+                if pool.holds_slot:
+                    _pool_slots.release()
+                return
+        idle = [
+            pool for pool in _open_pools if not pool.reclaim_requested and not pool._contexts_in_use
+        ]
+        if idle:
+            min(idle, key=lambda pool: pool.last_used).reclaim_requested = True
+
+
+def get_browser_pool(pool_size=None, headless=True):
+    """
+    gets or creates the calling thread's browser pool
 
+    Creating a pool takes one of the MAX_BROWSER_POOLS process-wide slots, which
+    close_browser_pool gives back. If none frees up within POOL_SLOT_TIMEOUT the
+    pool is launched anyway, rather than waiting on threads that never return.
 
-def get_browser_pool(pool_size=3, headless=True):
-    """gets or creates the global browser pool"""
-    global _browser_pool
-    if _browser_pool is None:
-        _browser_pool = BrowserPool(pool_size, headless)
-        _browser_pool.start()
-    return _browser_pool
+    Args:
+        pool_size: number of browsers/contexts, defaults to BUMI_CONTEXT_POOL_SIZE or 1
+            (a thread drives one page at a time)
+        headless: whether browsers run in headless mode
+    """
+    pool = getattr(_thread_state, "browser_pool", None)
+    if pool is not None and (pool.reclaim_requested or pool.uses >= BROWSER_POOL_MAX_USES):
+        close_browser_pool()
+        pool = None
+    if pool is None:
+        if pool_size is None:
+            pool_size = int(os.environ.get("BUMI_CONTEXT_POOL_SIZE", 1))
+        holds_slot = _acquire_pool_slot()
+        if not holds_slot:
+            print(f"Warning: No browser pool freed up, launching over {MAX_BROWSER_POOLS}")
+        pool = BrowserPool(pool_size, headless)
+        pool.holds_slot = holds_slot
+        try:
+            pool.start()
+        except Exception:
+            pool.close()
+            if holds_slot:
+                _pool_slots.release()
+            raise
+        _thread_state.browser_pool = pool
+        with _open_pools_lock:
+            _open_pools[pool] = threading.current_thread()
+    return pool
 
 
 def close_browser_pool():
-    """closes the global browser pool"""
-    global _browser_pool
-    if _browser_pool:
-        _browser_pool.close()
-        _browser_pool = None
+    """closes the calling thread's browser pool and frees its slot"""
+    pool = getattr(_thread_state, "browser_pool", None)
+    if pool:
+        _thread_state.browser_pool = None
+        with _open_pools_lock:
+            registered = _open_pools.pop(pool, None) is not None
+        try:
+            pool.close()
+        finally:
+            if registered and pool.holds_slot:
+                _pool_slots.release()
+
+
+# the main thread's pool (e.g. from the CLI) is closed when the interpreter exits
+atexit.register(close_browser_pool)
+
+
+def close_idle_browser_pool():
+    """
+    closes the calling thread's browser pool if no page is open and it has been
+    idle for BROWSER_POOL_IDLE_TIMEOUT or another thread asked for its slot
+    """
+    pool = getattr(_thread_state, "browser_pool", None)
+    if pool is None or pool._contexts_in_use:
+        return
+    if pool.reclaim_requested or time.monotonic() - pool.last_used >= BROWSER_POOL_IDLE_TIMEOUT:
+        close_browser_pool()
+
+
+def wait_result(future):
+    """
+    returns future.result(), closing this thread's pool meanwhile if it is asked for
+
+    Threads that wait on scrapes in other threads use this, so the slot their
+    idle pool holds can go to the threads they wait for.
+    """
+    while True:
+        try:
+            return future.result(timeout=POOL_RECLAIM_INTERVAL)
+        except FutureTimeoutError:
+            pool = getattr(_thread_state, "browser_pool", None)
+            if pool is not None and pool.reclaim_requested:
+                close_idle_browser_pool()
+
+
+@contextmanager
+def scrape_page(browser=None, standalone=False):
+    """
+    yields a fresh playwright page for one scrape and cleans it up afterwards
+
+    Without a browser the page is opened in one of this thread's warm pooled
+    contexts, which is reset and returned to the pool afterwards. The pool stays
+    open for later scrapes unless another thread asked for its slot.
+
+    Args:
+        browser: browser to open the page in, in a new context
+        standalone: if True, launches and closes a dedicated browser for this scrape
+    """
+    if standalone:
+        from playwright.sync_api import sync_playwright
+
+        with sync_playwright() as p:
+            own_browser = launch_browser(p)
+            try:
+                context = own_browser.new_context(**CONTEXT_OPTIONS)
+                block_resources(context)
+                yield context.new_page()
+            finally:
+                own_browser.close()
+        return
+
+    if browser is None:
+        pool = get_browser_pool()
+        context = pool.acquire_context()
+        try:
+            yield context.new_page()
+        finally:
+            pool.release_context(context)
+            pool.uses += 1
+            pool.last_used = time.monotonic()
+            if pool.reclaim_requested:
+                close_idle_browser_pool()
+        return
+
+    context = browser.new_context(**CONTEXT_OPTIONS)
+    block_resources(context)
+    try:
+        yield context.new_page()
+    finally:
+        context.close()
+
+
+def scrape_many(func, args_list, workers=4, on_complete=None):
+    """
+    runs func(*args) for every args tuple in args_list across worker threads
+
+    Each worker drives its own browser pool (playwright objects are bound to the
+    thread that created them) and closes it when the work runs out, so scrape_*
+    functions can be passed as-is. Per-host slots (see host_slot) still
+    cap how many requests hit letterboxd at once, and MAX_BROWSER_POOLS how many
+    browsers are open.
+
+    Args:
+        func: scraping function, e.g. scrape_user_diary
+        args_list: list of positional argument tuples
+        workers: number of worker threads
+        on_complete: optional callback(index, result, error) run after each call,
+            one at a time; error is None on success
+
+    Returns:
+        list of results in args_list order, None where func raised
+    """
+    tasks = queue.Queue()
+    for index, args in enumerate(args_list):
+        tasks.put_nowait((index, args))
+    results = [None] * len(args_list)
+    callback_lock = threading.Lock()
+
+    def worker():
+        try:
+            while True:
+                try:
+                    index, args = tasks.get_nowait()
+                except queue.Empty:
+                    return
+                error = None
+                try:
+                    results[index] = func(*args)
+                except Exception as e:
+                    error = e
+                    if on_complete is None:
+                        print(f"Error: Unable to scrape {args}: {e}")
+                if on_complete is not None:
+                    with callback_lock:
+                        on_complete(index, results[index], error)
+        finally:
+            close_browser_pool()
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(args_list)))) as executor:
+        futures = [executor.submit(worker) for _ in range(min(workers, len(args_list)))]
+        for future in futures:
+            wait_result(future)
+    return results
+
+
+class BrowserExecutor(Executor):
+    """
+    fixed-size thread pool for scrapes whose threads keep warm browser pools
+
+    A worker that finds no work for POOL_RECLAIM_INTERVAL closes its pool when
+    it has been idle for BROWSER_POOL_IDLE_TIMEOUT or another thread asked for
+    its slot, and closes it for good on shutdown.
+    """
+
+    def __init__(self, max_workers, thread_name_prefix="bumi-browser"):
+        """
+        Args:
+            max_workers: maximum number of worker threads
+            thread_name_prefix: name prefix of the worker threads
+        """
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self._tasks = queue.SimpleQueue()
+        self._threads = []
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    def submit(self, fn, /, *args, **kwargs):
+        """schedules fn(*args, **kwargs) and returns its Future"""
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            future = Future()
+            self._tasks.put((future, fn, args, kwargs))
+            if len(self._threads) < self.max_workers:
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"{self.thread_name_prefix}_{len(self._threads)}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+        return future
+
+    def _work(self):
+        """runs tasks until shutdown, closing the thread's pool when it idles"""
+        try:
+            while True:
+                try:
+                    task = self._tasks.get(timeout=POOL_RECLAIM_INTERVAL)
+                except queue.Empty:
+                    close_idle_browser_pool()
+                    continue
+                if task is None:
+                    return
+                future, fn, args, kwargs = task
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(fn(*args, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+        finally:
+            close_browser_pool()
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        """stops the workers once queued tasks are done, or cancels them first"""
+        with self._lock:
+            self._shutdown = True
+            threads = list(self._threads)
+        if cancel_futures:
+            while True:
+                try:
+                    task = self._tasks.get_nowait()
+                except queue.Empty:
+                    break
+                if task is not None:
+                    task[0].cancel()
+        for _ in threads:
+            self._tasks.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
 
 
 # ----- RATE LIMITING -----
@@ -96,36 +594,63 @@ def close_browser_pool():
 
 class RateLimiter:
     """
-    rate limiter with configurable delays between requests
+    token bucket rate limiter shared by all threads in the process
+
+    Tokens refill at one per min_delay seconds up to burst. Each request takes a
+    token; when none is left the caller reserves the next one and sleeps until it
+    is due, so concurrent callers queue fairly instead of all firing at once.
     """
 
-    def __init__(self, min_delay=1.0, max_delay=3.0, randomize=True):
+    def __init__(self, min_delay=1.0, max_delay=3.0, randomize=True, burst=1):
         """
         Args:
             min_delay: minimum delay between requests in seconds
             max_delay: maximum delay for randomized delays
-            randomize: if True, uses random delay between min and max
+            randomize: if True, adds up to max_delay - min_delay of jitter to waits
+            burst: number of requests allowed back to back before delays apply
         """
         self.min_delay = min_delay
         self.max_delay = max_delay
         self.randomize = randomize
-        self.last_request_time = 0
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self):
+        """takes a token and returns how long the caller must wait before using it"""
+        if self.min_delay <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            refill = (now - self._updated) / self.min_delay
+            self._tokens = min(float(self.burst), self._tokens + refill)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            delay = -self._tokens * self.min_delay
+        if self.randomize and self.max_delay > self.min_delay:
+            delay += random.uniform(0, self.max_delay - self.min_delay)
+        return delay
 
     def wait(self):
         """waits appropriate time before next request"""
-        elapsed = time.time() - self.last_request_time
-        if self.randomize:
-            delay = random.uniform(self.min_delay, self.max_delay)
-        else:
-            delay = self.min_delay
-        remaining = delay - elapsed
-        if remaining > 0:
-            time.sleep(remaining)
-        self.last_request_time = time.time()
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self):
+        """waits appropriate time before next request without blocking the event loop"""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
 
     def reset(self):
         """resets the rate limiter"""
-        self.last_request_time = 0
+        with self._lock:
+            self._tokens = float(self.burst)
+            self._updated = time.monotonic()
 
 
 # global rate limiter instance with polite defaults
@@ -143,11 +668,111 @@ def rate_limit_wait():
     _rate_limiter.wait()
 
 
+async def rate_limit_wait_async():
+    """applies rate limiting delay before a request from a coroutine"""
+    await _rate_limiter.wait_async()
+
+
+# ----- PER-HOST CONCURRENCY -----
+
+# maximum simultaneous requests to any one host, further requests queue for a slot
+DEFAULT_HOST_CONCURRENCY = 4
+
+_host_concurrency = DEFAULT_HOST_CONCURRENCY
+_host_semaphores = {}
+_host_waiting = {}
+_host_lock = threading.Lock()
+
+
+def set_host_concurrency(limit=DEFAULT_HOST_CONCURRENCY):
+    """configures the maximum number of concurrent requests per host"""
+    global _host_concurrency
+    with _host_lock:
+        _host_concurrency = limit
+        _host_semaphores.clear()
+
+
+def get_host_queue_depth(host=None):
+    """
+    returns how many requests are waiting for a per-host slot
+
+    Args:
+        host: host name to report on, or None for a dict of all hosts
+
+    Returns:
+        waiting count for host, or dict mapping host to waiting count
+    """
+    with _host_lock:
+        if host is None:
+            return dict(_host_waiting)
+        return _host_waiting.get(host, 0)
+
+
+@contextmanager
+def host_slot(url):
+    """holds one of the per-host concurrency slots for url while the block runs"""
+    host = urllib.parse.urlparse(url).netloc
+    with _host_lock:
+        semaphore = _host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(_host_concurrency)
+            _host_semaphores[host] = semaphore
+        _host_waiting[host] = _host_waiting.get(host, 0) + 1
+    try:
+        semaphore.acquire()
+    finally:
+        with _host_lock:
+            _host_waiting[host] -= 1
+    try:
+        yield
+    finally:
+        semaphore.release()
+
+
 # ----- RETRY MECHANISM -----
 
+# responses that will not change on retry
+PERMANENT_HTTP_STATUSES = frozenset({400, 401, 403, 404, 410})
+
+
+def is_transient_error(error):
+    """
+    default retry classifier: rate limits, server/network errors and timeouts are
+    worth retrying, anything else (bad URLs, programming errors) is not
+    """
+    if isinstance(error, (RateLimitedError, NetworkError, ScrapeTimeoutError, TimeoutError)):
+        return True
+    message = str(error)
+    return "timeout" in message.lower() or "net::" in message
+
+
+def _backoff_delay(attempt, base_delay, max_delay):
+    """returns a full-jitter exponential backoff delay for a zero-based attempt"""
+    return random.uniform(0, min(base_delay * (2**attempt), max_delay))
+
+
+def _parse_retry_after(value):
+    """parses a Retry-After header (seconds or HTTP date) into seconds, or None"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
 
 def retry_with_backoff(
-    func, max_retries=3, base_delay=1.0, max_delay=30.0, exceptions=(Exception,)
+    func,
+    max_retries=3,
+    base_delay=1.0,
+    max_delay=30.0,
+    exceptions=(Exception,),
+    retryable=None,
 ):
     """
     executes a function with exponential backoff retry logic
@@ -158,18 +783,21 @@ def retry_with_backoff(
         base_delay: initial delay in seconds
         max_delay: maximum delay between retries
         exceptions: tuple of exceptions to catch and retry
+        retryable: optional predicate(exception) -> bool; exceptions it rejects
+            are not retried
 
     Returns:
         result of func if successful, None if all retries fail
     """
-    last_exception = None
     for attempt in range(max_retries + 1):
         try:
             return func()
         except exceptions as e:
-            last_exception = e
+            if retryable is not None and not retryable(e):
+                print(f"Attempt {attempt + 1} failed with non-retryable error: {e}")
+                return None
             if attempt < max_retries:
-                delay = min(base_delay * (2**attempt), max_delay)
+                delay = _backoff_delay(attempt, base_delay, max_delay)
                 print(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay:.1f}s...")
                 time.sleep(delay)
             else:
@@ -177,33 +805,87 @@ def retry_with_backoff(
     return None
 
 
-def make_request_with_retry(page, url, max_retries=3, base_delay=1.0):
+async def retry_with_backoff_async(
+    coro_fn,
+    max_retries=3,
+    base_delay=1.0,
+    max_delay=30.0,
+    exceptions=(Exception,),
+    retryable=None,
+):
+    """
+    awaits a coroutine function with exponential backoff retry logic
+
+    Same arguments as retry_with_backoff, but coro_fn is called with no arguments
+    and awaited, and delays use asyncio.sleep so the event loop keeps running.
+
+    Returns:
+        result of coro_fn if successful, None if all retries fail
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return await coro_fn()
+        except exceptions as e:
+            if retryable is not None and not retryable(e):
+                print(f"Attempt {attempt + 1} failed with non-retryable error: {e}")
+                return None
+            if attempt < max_retries:
+                delay = _backoff_delay(attempt, base_delay, max_delay)
+                print(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+            else:
+                print(f"All {max_retries + 1} attempts failed. Last error: {e}")
+    return None
+
+
+def make_request_with_retry(page, url, max_retries=3, base_delay=1.0, max_delay=30.0):
     """
     navigates to a URL with retry logic for transient failures
 
+    Server errors, timeouts and network errors are retried with jittered
+    exponential backoff; 429 responses wait for the server's Retry-After period
+    when it sends one, and give up when it is longer than max_delay. Permanent
+    failures (see PERMANENT_HTTP_STATUSES and is_transient_error) return
+    immediately.
+
     Args:
         page: playwright page object
         url: URL to navigate to
         max_retries: maximum retry attempts
         base_delay: initial backoff delay
+        max_delay: maximum delay between retries
 
     Returns:
         True if successful, False otherwise
     """
     for attempt in range(max_retries + 1):
         try:
-            response = page.goto(url)
+            with host_slot(url):
+                response = page.goto(url, wait_until=PAGE_LOAD_STATE)
             if response and response.ok:
                 return True
+            if response and response.status == 429:
+                retry_after = _parse_retry_after(response.headers.get("retry-after"))
+                raise RateLimitedError(url, retry_after=retry_after)
             if response and response.status >= 500:
-                raise Exception(f"Server error: {response.status}")
+                raise NetworkError(url, message=f"Server error: {response.status}")
+            if response and response.status in PERMANENT_HTTP_STATUSES:
+                print(f"Request failed with status {response.status}: {url}")
+                return False
             return True
         except Exception as e:
+            if not is_transient_error(e):
+                print(f"Request failed with non-retryable error: {e}")
+                return False
             if attempt < max_retries:
-                delay = min(base_delay * (2**attempt), 30.0)
-                print(
-                    f"Request failed (attempt {attempt + 1}): {e}. Retrying in {delay:.1f}s..."
-                )
+                if isinstance(e, RateLimitedError) and e.retry_after is not None:
+                    if e.retry_after > max_delay:
+                        print(f"Request rate limited for {e.retry_after:.0f}s, giving up: {url}")
+                        return False
+                    delay = e.retry_after
+                else:
+                    delay = _backoff_delay(attempt, base_delay, max_delay)
+                print(f"Request failed (attempt {attempt + 1}): {e}. Retrying in {delay:.1f}s...")
                 time.sleep(delay)
             else:
                 print(f"Request failed after {max_retries + 1} attempts: {e}")
@@ -3,13 +3,6 @@
 
 # ----- REQUIRED IMPORTS -----
 
-import os
-import time
-import json
-import hashlib
-from pathlib import Path
-from playwright.sync_api import sync_playwright
-
 # Re-export everything from submodules for backward compatibility
 from .exceptions import (
     BumiException,
@@ -50,9 +43,11 @@ from .cache import (
     cache_set,
     cache_clear,
     cache_clear_expired,
+    CACHE_MAX_AGE,
     CACHE_DIR,
     DEFAULT_TTL,
-    _get_cache_path,
+    MemoryCache,
+    _hash_cache_key,
 )
 
 from .progress import (
@@ -67,17 +62,45 @@ from .config import (
     apply_timeouts_to_page,
     safe_goto,
     safe_wait_for_selector,
+    PAGE_LOAD_STATE,
 )
 
 from .browser import (
     BrowserPool,
     get_browser_pool,
     close_browser_pool,
+    close_idle_browser_pool,
+    wait_result,
+    BrowserExecutor,
+    MAX_BROWSER_POOLS,
+    scrape_page,
+    scrape_many,
+    block_resources,
+    disable_playwright_stack_capture,
+    launch_browser,
+    BLOCKED_RESOURCE_TYPES,
     RateLimiter,
     set_rate_limit,
     rate_limit_wait,
+    rate_limit_wait_async,
     retry_with_backoff,
+    retry_with_backoff_async,
     make_request_with_retry,
+    is_transient_error,
+    set_host_concurrency,
+    get_host_queue_depth,
+    host_slot,
+)
+
+from .fetcher import (
+    fetch_html,
+    fetch_documents,
+    iter_documents,
+    extract_items,
+    page_loader,
+    http_fetch_available,
+    get_http_client,
+    close_http_client,
 )
 
 from .parsers import (
@@ -112,6 +135,7 @@ from .snapshot import (
 
 from .scrapers import (
     scrape_film_details,
+    scrape_film_details_batch,
     scrape_user_reviews,
     scrape_user_diary,
     scrape_user_lists,
@@ -122,6 +146,14 @@ from .scrapers import (
     scrape_letterboxd_user_films,
     scrape_letterboxd_user,
     scrape_letterboxd,
+    iter_user_reviews,
+    iter_user_diary,
+    iter_letterboxd_user_watchlist,
+    iter_letterboxd_user_films,
+    iter_user_lists,
+    iter_list_contents,
+    iter_user_followers,
+    iter_user_following,
 )
 
 from .api import (
@@ -140,6 +172,7 @@ from .webhooks import (
 
 from .search import (
     search_films,
+    search_films_batch,
     search_films_advanced,
     get_popular_films,
     scrape_activity_feed,
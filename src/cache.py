@@ -1,67 +1,191 @@
 # ----- CACHING SYSTEM -----
 
+import os
 import time
 import json
+import sqlite3
 import hashlib
+import functools
+import threading
 from pathlib import Path
+from collections import OrderedDict
+
+# optional speedup: pip install orjson
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 CACHE_DIR = Path.home() / ".bumi_cache"
+CACHE_DB = CACHE_DIR / "cache.sqlite3"
 DEFAULT_TTL = 3600  # 1 hour in seconds
 
+# no reader keeps entries longer than this (the page cache revalidates pages for
+# a week), so every CACHE_SWEEP_INTERVAL writes older entries are deleted
+CACHE_MAX_AGE = 7 * 24 * 3600
+CACHE_SWEEP_INTERVAL = 1000
+
+_conn = None
+_conn_lock = threading.Lock()
+_writes_since_sweep = 0
+
+
+def _get_connection():
+    """opens the shared cache database on first use, must be called with _conn_lock held"""
+    global _conn
+    if _conn is None:
+        CACHE_DIR.mkdir(exist_ok=True)
+        conn = sqlite3.connect(CACHE_DB, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(key TEXT PRIMARY KEY, ts REAL NOT NULL, data TEXT NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS cache_ts ON cache (ts)")
+        _conn = conn
+    return _conn
+
+
+def _cache_exists():
+    """checks whether there is a cache to clear, without creating one"""
+    return _conn is not None or CACHE_DIR.exists()
+
+
+def _dumps(data):
+    """encodes a cache payload, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":"))
+
+
+def _loads(payload):
+    """decodes a cache payload written by _dumps"""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
 
-def _get_cache_path(cache_key):
-    """returns the file path for a cache entry"""
-    CACHE_DIR.mkdir(exist_ok=True)
-    hashed_key = hashlib.md5(cache_key.encode()).hexdigest()
-    return CACHE_DIR / f"{hashed_key}.json"
+@functools.lru_cache(maxsize=1024)
+def _hash_cache_key(cache_key):
+    """returns the stored key for a cache entry, a 64-bit blake2b digest of cache_key"""
+    return hashlib.blake2b(cache_key.encode(), digest_size=8).hexdigest()
 
 
 def cache_get(cache_key, ttl=DEFAULT_TTL):
     """retrieves cached data if it exists and hasn't expired"""
-    cache_path = _get_cache_path(cache_key)
-    if not cache_path.exists():
-        return None
+    hashed_key = _hash_cache_key(cache_key)
     try:
-        with open(cache_path, "r") as f:
-            cached = json.load(f)
-        cached_time = cached.get("timestamp", 0)
-        if time.time() - cached_time > ttl:
-            cache_path.unlink()
-            return None
-        return cached.get("data")
-    except (json.JSONDecodeError, IOError):
+        with _conn_lock:
+            conn = _get_connection()
+            row = conn.execute("SELECT ts, data FROM cache WHERE key = ?", (hashed_key,)).fetchone()
+            if row is None:
+                return None
+            if time.time() - row[0] > ttl:
+                conn.execute("DELETE FROM cache WHERE key = ?", (hashed_key,))
+                return None
+        return _loads(row[1])
+    except (json.JSONDecodeError, sqlite3.Error):
         return None
 
 
 def cache_set(cache_key, data):
-    """stores data in cache with current timestamp"""
-    cache_path = _get_cache_path(cache_key)
-    CACHE_DIR.mkdir(exist_ok=True)
+    """stores data in cache with current timestamp, sweeping out old entries now and then"""
+    global _writes_since_sweep
+    hashed_key = _hash_cache_key(cache_key)
     try:
-        with open(cache_path, "w") as f:
-            json.dump({"timestamp": time.time(), "data": data}, f)
-    except IOError as e:
+        payload = _dumps(data)
+        with _conn_lock:
+            conn = _get_connection()
+            now = time.time()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, ts, data) VALUES (?, ?, ?)",
+                (hashed_key, now, payload),
+            )
+            _writes_since_sweep += 1
+            if _writes_since_sweep >= CACHE_SWEEP_INTERVAL:
+                _writes_since_sweep = 0
+                conn.execute("DELETE FROM cache WHERE ts < ?", (now - CACHE_MAX_AGE,))
+    except (TypeError, ValueError, sqlite3.Error) as e:
         print(f"Warning: Failed to write cache: {e}")
 
 
 def cache_clear():
     """clears all cached data"""
-    if CACHE_DIR.exists():
-        for cache_file in CACHE_DIR.glob("*.json"):
-            cache_file.unlink()
+    if _cache_exists():
+        with _conn_lock:
+            _get_connection().execute("DELETE FROM cache")
+        # entries written by older versions, one json file per key
+        with os.scandir(CACHE_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    os.unlink(entry.path)
         print("Cache cleared successfully")
 
 
 def cache_clear_expired(ttl=DEFAULT_TTL):
-    """removes expired cache entries"""
-    if not CACHE_DIR.exists():
+    """removes cache entries older than ttl seconds"""
+    if not _cache_exists():
         return
-    current_time = time.time()
-    for cache_file in CACHE_DIR.glob("*.json"):
-        try:
-            with open(cache_file, "r") as f:
-                cached = json.load(f)
-            if current_time - cached.get("timestamp", 0) > ttl:
-                cache_file.unlink()
-        except (json.JSONDecodeError, IOError):
-            cache_file.unlink()
+    with _conn_lock:
+        _get_connection().execute("DELETE FROM cache WHERE ts < ?", (time.time() - ttl,))
+
+
+# ----- IN-PROCESS CACHE -----
+
+
+class MemoryCache:
+    """
+    thread-safe in-process LRU cache with per-entry expiry
+    """
+
+    def __init__(self, maxsize=1024, ttl=DEFAULT_TTL):
+        """
+        Args:
+            maxsize: maximum number of entries before least recently used are evicted
+            ttl: default time to live for entries in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """returns the cached value for key, or default if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        """stores value under key, evicting the least recently used entry when full"""
+        expires_at = time.monotonic() + (ttl if ttl is not None else self.ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key, default=None):
+        """removes key and returns its value"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return entry[1] if entry else default
+
+    def clear(self):
+        """removes all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
@@ -24,37 +24,43 @@ def compare_users(username1, username2, paginate=True):
     print(f"Fetching films for {username2}...")
     films2 = scrape_letterboxd_user_films(url2, paginate=paginate)
 
-    # Create sets of film slugs for comparison
-    slugs1 = {f["film_slug"] for f in films1 if f.get("film_slug")}
-    slugs2 = {f["film_slug"] for f in films2 if f.get("film_slug")}
-
-    # Find common and unique
-    common_slugs = slugs1 & slugs2
-    unique_to_1 = slugs1 - slugs2
-    unique_to_2 = slugs2 - slugs1
-
-    # Build film lookup for details
-    film_lookup1 = {f["film_slug"]: f for f in films1 if f.get("film_slug")}
-    film_lookup2 = {f["film_slug"]: f for f in films2 if f.get("film_slug")}
-
-    # Get full film data for each category
-    common_films = [film_lookup1.get(s) or film_lookup2.get(s) for s in common_slugs]
-    unique_films_1 = [film_lookup1[s] for s in unique_to_1]
-    unique_films_2 = [film_lookup2[s] for s in unique_to_2]
+    # index the smaller library once and stream the larger one against it, so
+    # every partition comes out of a single pass without building a union set
+    swapped = len(films1) > len(films2)
+    small, large = (films2, films1) if swapped else (films1, films2)
+    small_lookup = {f["film_slug"]: f for f in small if f.get("film_slug")}
+    common_lookup = {}
+    unique_large = {}
+    for film in large:
+        slug = film.get("film_slug")
+        if not slug:
+            continue
+        if slug in small_lookup:
+            # user1's copy of a shared film is kept
+            common_lookup[slug] = film if swapped else small_lookup[slug]
+        else:
+            unique_large[slug] = film
+    unique_small = [f for s, f in small_lookup.items() if s not in common_lookup]
+
+    common_films = list(common_lookup.values())
+    unique_large = list(unique_large.values())
+    unique_films_1, unique_films_2 = (
+        (unique_large, unique_small) if swapped else (unique_small, unique_large)
+    )
 
     # Calculate compatibility score
-    total_unique = len(slugs1 | slugs2)
-    compatibility = (len(common_slugs) / total_unique * 100) if total_unique > 0 else 0
+    total_unique = len(small_lookup) + len(unique_large)
+    compatibility = (len(common_films) / total_unique * 100) if total_unique > 0 else 0
 
     return {
         "user1": username1,
         "user2": username2,
         "statistics": {
-            "user1_total_films": len(slugs1),
-            "user2_total_films": len(slugs2),
-            "common_count": len(common_slugs),
-            "unique_to_user1_count": len(unique_to_1),
-            "unique_to_user2_count": len(unique_to_2),
+            "user1_total_films": len(common_films) + len(unique_films_1),
+            "user2_total_films": len(common_films) + len(unique_films_2),
+            "common_count": len(common_films),
+            "unique_to_user1_count": len(unique_films_1),
+            "unique_to_user2_count": len(unique_films_2),
             "compatibility_percentage": round(compatibility, 2),
         },
         "common_films": common_films,
@@ -1,5 +1,16 @@
 # ----- TIMEOUT CONFIGURATION -----
 
+# letterboxd pages are server rendered, so scraping can start once the DOM is
+# parsed instead of waiting for every subresource to fire the load event
+PAGE_LOAD_STATE = "domcontentloaded"
+
+# identity shared by browser contexts and plain HTTP fetches
+USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+)
+ACCEPT_LANGUAGE = "en-US,en;q=0.9"
+
 
 class TimeoutConfig:
     """
@@ -60,17 +71,16 @@ def safe_goto(page, url, timeout=None):
     Returns:
         response object if successful, None on timeout
     """
-    config = get_timeout_config()
-    effective_timeout = timeout or config.page_load_timeout
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    effective_timeout = timeout or _timeout_config.page_load_timeout
     try:
-        response = page.goto(url, timeout=effective_timeout)
-        return response
+        return page.goto(url, timeout=effective_timeout, wait_until=PAGE_LOAD_STATE)
+    except PlaywrightTimeoutError:
+        print(f"Timeout loading {url} after {effective_timeout}ms")
     except Exception as e:
-        if "timeout" in str(e).lower():
-            print(f"Timeout loading {url} after {effective_timeout}ms")
-        else:
-            print(f"Error loading {url}: {e}")
-        return None
+        print(f"Error loading {url}: {e}")
+    return None
 
 
 def safe_wait_for_selector(page, selector, timeout=None):
@@ -85,11 +95,13 @@ def safe_wait_for_selector(page, selector, timeout=None):
     Returns:
         element if found, None on timeout
     """
-    config = get_timeout_config()
-    effective_timeout = timeout or config.element_wait_timeout
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    effective_timeout = timeout or _timeout_config.element_wait_timeout
     try:
         return page.wait_for_selector(selector, timeout=effective_timeout)
-    except Exception as e:
-        if "timeout" in str(e).lower():
-            print(f"Timeout waiting for {selector} after {effective_timeout}ms")
-        return None
+    except PlaywrightTimeoutError:
+        print(f"Timeout waiting for {selector} after {effective_timeout}ms")
+    except Exception:
+        pass
+    return None
@@ -3,10 +3,15 @@
 import json
 import csv
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
 
+# optional speedup: pip install orjson
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def export_to_csv(data, output_file, data_key=None):
+
+def export_to_csv(data, output_file, data_key=None, sort_columns=False):
     """
     exports scraped data to CSV format
 
@@ -14,6 +19,8 @@ def export_to_csv(data, output_file, data_key=None):
         data: dict or list of dicts to export
         output_file: path to output CSV file
         data_key: if data is nested dict, key to extract list from
+        sort_columns: if True, columns are sorted by name instead of kept in the
+            order they first appear
 
     Returns:
         path to created CSV file
@@ -30,36 +37,38 @@ def export_to_csv(data, output_file, data_key=None):
         print("No data to export")
         return None
 
-    # flatten nested dicts for CSV
-    def flatten_dict(d, parent_key="", sep="_"):
-        items = []
+    # flatten nested dicts for CSV, writing every level into one row dict
+    def flatten_dict(d, row=None, parent_key="", sep="_"):
+        if row is None:
+            row = {}
         for k, v in d.items():
             new_key = f"{parent_key}{sep}{k}" if parent_key else k
             if isinstance(v, dict):
-                items.extend(flatten_dict(v, new_key, sep).items())
+                flatten_dict(v, row, new_key, sep)
             elif isinstance(v, list):
-                items.append((new_key, str(v)))
+                row[new_key] = str(v)
             else:
-                items.append((new_key, v))
-        return dict(items)
-
-    flattened = [
-        flatten_dict(item) if isinstance(item, dict) else {"value": item}
-        for item in items
-    ]
-
-    # get all unique keys
-    all_keys = set()
-    for item in flattened:
-        all_keys.update(item.keys())
-    fieldnames = sorted(all_keys)
-
-    with open(output_file, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(flattened)
-
-    print(f"Exported {len(flattened)} items to {output_file}")
+                row[new_key] = v
+        return row
+
+    # rows are flattened on the fly in both passes instead of being kept in memory
+    def flattened():
+        for item in items:
+            yield flatten_dict(item) if isinstance(item, dict) else {"value": item}
+
+    # get all unique keys in first-seen order
+    all_keys = {}
+    for row in flattened():
+        all_keys.update(row)
+    fieldnames = sorted(all_keys) if sort_columns else list(all_keys)
+
+    with open(output_file, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        # plain rows in header order; DictWriter would re-check every row's keys
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows([row.get(key, "") for key in fieldnames] for row in flattened())
+
+    print(f"Exported {len(items)} items to {output_file}")
     return output_file
 
 
@@ -110,12 +119,9 @@ def export_to_xml(data, output_file, root_element="data"):
             else:
                 item_el.text = str(item)
 
-    # pretty print
-    xml_str = ET.tostring(root, encoding="unicode")
-    pretty_xml = minidom.parseString(xml_str).toprettyxml(indent="  ")
-
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(pretty_xml)
+    # pretty print in place, no re-parse
+    ET.indent(root, space="  ")
+    ET.ElementTree(root).write(output_file, encoding="utf-8", xml_declaration=True)
 
     print(f"Exported to {output_file}")
     return output_file
@@ -133,8 +139,14 @@ def export_to_json(data, output_file, indent=2):
     Returns:
         path to created JSON file
     """
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, ensure_ascii=False)
+    # orjson only knows two-space indentation
+    if orjson is not None and indent in (2, None):
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(data, option=option))
+    else:
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
     print(f"Exported to {output_file}")
     return output_file
 
@@ -170,4 +182,8 @@ def export_data(data, output_file, format="json"):
 
 def pretty_print_json(json_object):
     """pretty prints a JSON object to stdout"""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        print(orjson.dumps(json_object, option=option).decode())
+        return
     print(json.dumps(json_object, indent=2, ensure_ascii=False))
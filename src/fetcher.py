@@ -0,0 +1,425 @@
+# ----- PAGE FETCHING -----
+
+import re
+import json
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+
+from .browser import scrape_page, host_slot, is_transient_error, _backoff_delay
+from .cache import cache_get, cache_set
+from .config import PAGE_LOAD_STATE, USER_AGENT, ACCEPT_LANGUAGE
+
+# optional fast path: pip install "bumi[fast]"
+try:
+    import httpx
+
+    # selectolax 1.0 dropped the modest backend behind selectolax.parser
+    try:
+        from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    except ImportError:
+        from selectolax.parser import HTMLParser
+except ImportError:
+    httpx = None
+    HTMLParser = None
+
+DEFAULT_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Language": ACCEPT_LANGUAGE,
+}
+
+DEFAULT_FETCH_WORKERS = 4
+
+# connection pool of the shared HTTP client; per-host slots decide how many are
+# actually used at once (see set_host_concurrency)
+HTTP_MAX_CONNECTIONS = 32
+
+# pages younger than PAGE_CACHE_TTL are served from the disk cache; older ones
+# are kept for PAGE_CACHE_STALE_TTL and revalidated with their ETag/Last-Modified
+PAGE_CACHE_TTL = 3600
+PAGE_CACHE_STALE_TTL = 7 * 24 * 3600
+
+# browser navigations that fail with a transient error (timeouts, net:: errors)
+# are retried this many times with jittered exponential backoff
+NAVIGATION_RETRIES = 2
+NAVIGATION_RETRY_DELAY = 0.5
+
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def http_fetch_available():
+    """returns True when httpx and selectolax are installed for plain HTTP scraping"""
+    return HTMLParser is not None
+
+
+def get_http_client():
+    """gets or creates the shared keep-alive HTTP/2 client (thread-safe)"""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                http2=True,
+                headers=DEFAULT_HEADERS,
+                follow_redirects=True,
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+                ),
+            )
+    return _http_client
+
+
+def close_http_client():
+    """closes the shared HTTP client"""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+
+
+def fetch_html(url, cache_ttl=PAGE_CACHE_TTL):
+    """
+    fetches and parses a page over plain HTTP
+
+    Args:
+        url: page URL
+        cache_ttl: seconds a cached copy is used without asking the server, 0 disables
+            the page cache
+
+    Returns:
+        selectolax HTMLParser tree (empty for a 404), or None when the fast path is
+        not installed or the page could not be fetched without a browser
+    """
+    if not http_fetch_available():
+        return None
+
+    cache_key = f"page:{url}"
+    cached = cache_get(cache_key, ttl=PAGE_CACHE_STALE_TTL) if cache_ttl else None
+    if cached and time.time() - cached["fetched_at"] < cache_ttl:
+        return HTMLParser(cached["html"])
+
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+    try:
+        with host_slot(url):
+            response = get_http_client().get(url, headers=headers)
+    except httpx.HTTPError as e:
+        print(f"HTTP fetch failed for {url}: {e}")
+        return None
+
+    if response.status_code == 304 and cached:
+        cached["fetched_at"] = time.time()
+        cache_set(cache_key, cached)
+        return HTMLParser(cached["html"])
+    if response.status_code == 404:
+        return HTMLParser("")
+    if response.status_code != 200:
+        # bot challenges and rate limits are left to the browser
+        return None
+
+    html = response.text
+    if cache_ttl:
+        cache_set(
+            cache_key,
+            {
+                "fetched_at": time.time(),
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified"),
+                "html": html,
+            },
+        )
+    return HTMLParser(html)
+
+
+# ----- FIELD EXTRACTION -----
+#
+# scrapers describe what to read as a dict of field name -> (selector, kind, attr):
+#   "text"   normalized text of the first match (see _node_text), or None
+#   "texts"  list of normalized texts of every match
+#   "attr"   attribute attr of the first match, or None
+#   "exists" True if anything matches
+#   "items"  list of every match read with the nested field spec passed as attr
+# a selector of None refers to the item element itself
+
+
+# text is read the same way over HTTP and in the browser: whitespace collapsed and
+# a line break for every <br> and block element, as innerText does; inline elements
+# add nothing, so "caf<i>é</i>s" reads "cafés". Stylesheets are not consulted, so an
+# inline element styled as a block (e.g. profile statistic labels) runs into its
+# neighbour and is read on its own by the scraper that needs it
+_BLOCK_TAGS = frozenset(
+    "address article aside blockquote dd div dl dt figcaption figure footer form h1 h2 h3 "
+    "h4 h5 h6 header hr li main nav ol p pre section table tbody td tfoot th thead tr ul".split()
+)
+_SKIPPED_TAGS = frozenset({"script", "style", "template", "noscript"})
+_SPACE_RE = re.compile(r"\s+")
+
+
+def _normalize_text(raw):
+    """turns the raw text collected by _node_text or nodeText into trimmed lines"""
+    lines = (line.strip() for line in raw.split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def _node_text(node):
+    """returns the normalized text of a selectolax node, like nodeText in _EXTRACT_JS"""
+    parts = []
+
+    def walk(el):
+        for child in el.iter(include_text=True):
+            tag = child.tag
+            if tag == "-text":
+                parts.append(_SPACE_RE.sub(" ", child.text(deep=False)))
+            elif tag == "br":
+                parts.append("\n")
+            elif tag in _BLOCK_TAGS:
+                parts.append("\n")
+                walk(child)
+                parts.append("\n")
+            elif tag not in _SKIPPED_TAGS and not tag.startswith("-"):
+                walk(child)
+
+    walk(node)
+    return _normalize_text("".join(parts))
+
+
+def _extract_from_node(node, specs):
+    """reads (name, (selector, kind, attr)) specs from a selectolax node or tree"""
+    data = {}
+    for name, (selector, kind, attr) in specs:
+        if kind == "texts":
+            data[name] = [_node_text(el) for el in node.css(selector)]
+            continue
+        if kind == "items":
+            specs_of_item = tuple(attr.items())
+            data[name] = [_extract_from_node(el, specs_of_item) for el in node.css(selector)]
+            continue
+        el = node.css_first(selector) if selector else node
+        if kind == "exists":
+            data[name] = el is not None
+        elif el is None:
+            data[name] = None
+        elif kind == "text":
+            data[name] = _node_text(el)
+        else:
+            data[name] = el.attributes.get(attr)
+    return data
+
+
+# same reader run inside the browser, so a whole page is extracted in one round trip
+_EXTRACT_JS = """
+([itemSelector, fields]) => {
+    const blockTags = new Set(BLOCK_TAGS);
+    const skippedTags = new Set(SKIPPED_TAGS);
+    const nodeText = (node) => {
+        const parts = [];
+        const walk = (el) => {
+            for (const child of el.childNodes) {
+                if (child.nodeType === Node.TEXT_NODE) {
+                    parts.push(child.data.replace(/\\s+/g, " "));
+                    continue;
+                }
+                if (child.nodeType !== Node.ELEMENT_NODE) continue;
+                const tag = child.localName;
+                if (tag === "br") {
+                    parts.push("\\n");
+                } else if (blockTags.has(tag)) {
+                    parts.push("\\n");
+                    walk(child);
+                    parts.push("\\n");
+                } else if (!skippedTags.has(tag)) {
+                    walk(child);
+                }
+            }
+        };
+        walk(node);
+        return parts
+            .join("")
+            .split("\\n")
+            .map((line) => line.trim())
+            .filter((line) => line)
+            .join("\\n");
+    };
+    const read = (item, specs) => {
+        const data = {};
+        for (const [name, [selector, kind, attr]] of specs) {
+            if (kind === "texts") {
+                const matches = item.querySelectorAll(selector);
+                data[name] = Array.from(matches, nodeText);
+                continue;
+            }
+            if (kind === "items") {
+                const itemSpecs = Object.entries(attr);
+                const matches = item.querySelectorAll(selector);
+                data[name] = Array.from(matches, (el) => read(el, itemSpecs));
+                continue;
+            }
+            const el = selector ? item.querySelector(selector) : item;
+            if (kind === "exists") data[name] = el !== null;
+            else if (el === null) data[name] = null;
+            else if (kind === "text") data[name] = nodeText(el);
+            else data[name] = el.getAttribute(attr);
+        }
+        return data;
+    };
+    const specs = Object.entries(fields);
+    if (itemSelector === null) return read(document, specs);
+    return Array.from(document.querySelectorAll(itemSelector), (item) => read(item, specs));
+}
+"""
+_EXTRACT_JS = _EXTRACT_JS.replace("BLOCK_TAGS", json.dumps(sorted(_BLOCK_TAGS))).replace(
+    "SKIPPED_TAGS", json.dumps(sorted(_SKIPPED_TAGS))
+)
+
+
+def extract_items(page, item_selector, fields):
+    """
+    reads fields from every item_selector match on a playwright page in one round trip
+
+    Returns:
+        list of dicts with one key per field, or a single dict for the whole page
+        when item_selector is None
+    """
+    return page.evaluate(_EXTRACT_JS, [item_selector, fields])
+
+
+class _HtmlDocument:
+    """page fetched over HTTP and parsed with selectolax"""
+
+    via_browser = False
+
+    def __init__(self, tree):
+        self.tree = tree
+
+    def extract(self, fields):
+        return _extract_from_node(self.tree, fields.items())
+
+    def extract_all(self, item_selector, fields):
+        specs = tuple(fields.items())
+        return [_extract_from_node(node, specs) for node in self.tree.css(item_selector)]
+
+    def exists(self, selector):
+        return self.tree.css_first(selector) is not None
+
+
+class _BrowserDocument:
+    """page loaded in a playwright browser"""
+
+    via_browser = True
+
+    def __init__(self, page):
+        self.page = page
+
+    def extract(self, fields):
+        return self.page.evaluate(_EXTRACT_JS, [None, fields])
+
+    def extract_all(self, item_selector, fields):
+        return extract_items(self.page, item_selector, fields)
+
+    def exists(self, selector):
+        return self.page.query_selector(selector) is not None
+
+
+def fetch_documents(urls, max_workers=DEFAULT_FETCH_WORKERS):
+    """
+    fetches several pages concurrently over plain HTTP
+
+    Args:
+        urls: page URLs
+        max_workers: number of fetch threads (per-host limits still apply, see host_slot)
+
+    Returns:
+        list of documents in url order, with None for pages that need a browser
+    """
+    if not http_fetch_available() or not urls:
+        return [None] * len(urls)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        trees = list(executor.map(fetch_html, urls))
+    return [_HtmlDocument(tree) if tree is not None else None for tree in trees]
+
+
+def iter_documents(urls, window=DEFAULT_FETCH_WORKERS):
+    """
+    returns an iterator over the documents of urls in order, fetching at most
+    window pages ahead
+
+    The first window pages start fetching right away. Unlike fetch_documents,
+    only window pages are held or in flight at once, and closing the iterator
+    early cancels the fetches not yet started.
+
+    Args:
+        urls: page URLs
+        window: number of pages fetched ahead of the consumer
+
+    Returns:
+        generator of documents, with None for pages that need a browser
+    """
+    urls = list(urls)
+    if not http_fetch_available() or not urls:
+        return (None for _ in urls)
+    executor = ThreadPoolExecutor(max_workers=min(window, len(urls)))
+    pending = deque(executor.submit(fetch_html, url) for url in urls[:window])
+
+    def documents():
+        next_index = len(pending)
+        try:
+            while pending:
+                tree = pending.popleft().result()
+                if next_index < len(urls):
+                    pending.append(executor.submit(fetch_html, urls[next_index]))
+                    next_index += 1
+                yield _HtmlDocument(tree) if tree is not None else None
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    return documents()
+
+
+@contextmanager
+def page_loader(browser=None, standalone=False):
+    """
+    yields a load(url, cache_ttl=PAGE_CACHE_TTL) function that returns a document for url
+
+    Documents come from plain HTTP (and the page cache, see fetch_html) when
+    possible; otherwise a browser page is opened on first use (see scrape_page)
+    and reused for later loads. Transient navigation failures are retried up to
+    NAVIGATION_RETRIES times.
+
+    Args:
+        browser: browser to use for the fallback page
+        standalone: if True, the fallback launches a dedicated browser
+    """
+    stack = ExitStack()
+    page = None
+
+    def load(url, cache_ttl=PAGE_CACHE_TTL):
+        nonlocal page
+        tree = fetch_html(url, cache_ttl)
+        if tree is not None:
+            return _HtmlDocument(tree)
+        if page is None:
+            page = stack.enter_context(scrape_page(browser, standalone))
+        for attempt in range(NAVIGATION_RETRIES + 1):
+            try:
+                with host_slot(url):
+                    page.goto(url, wait_until=PAGE_LOAD_STATE)
+                break
+            except Exception as e:
+                if attempt == NAVIGATION_RETRIES or not is_transient_error(e):
+                    raise
+                delay = _backoff_delay(attempt, NAVIGATION_RETRY_DELAY, 8.0)
+                print(f"Loading {url} failed: {e}. Retrying in {delay:.1f}s...")
+                time.sleep(delay)
+        return _BrowserDocument(page)
+
+    with stack:
+        yield load
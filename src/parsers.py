@@ -1,7 +1,27 @@
 # ----- STATISTICS PARSING -----
 
 import re
-from playwright.sync_api import sync_playwright
+
+from .fetcher import page_loader
+
+STAT_PATTERN = re.compile(r"([\d,]+)\s*(\w+)")
+RUNTIME_MINS_PATTERN = re.compile(r"(\d+)\s*mins?")
+RUNTIME_HOURS_PATTERN = re.compile(r"(\d+)\s*h")
+RUNTIME_MINUTES_PATTERN = re.compile(r"(\d+)\s*m")
+TWITTER_USERNAME_PATTERN = re.compile(r"twitter\.com/(\w+)")
+INSTAGRAM_USERNAME_PATTERN = re.compile(r"instagram\.com/(\w+)")
+
+# profile fields read by extract_bio_links (see fetcher for the spec format)
+BIO_FIELDS = {
+    "pro": ("span.badge.-pro", "exists", None),
+    "patron": ("span.badge.-patron", "exists", None),
+    "website": ("a.icon-website", "attr", "href"),
+    "twitter": ("a.icon-twitter", "attr", "href"),
+}
+BIO_LINK_FIELDS = {
+    "url": (None, "attr", "href"),
+    "text": (None, "text", None),
+}
 
 
 def parse_statistic_value(stat_string):
@@ -18,7 +38,7 @@ def parse_statistic_value(stat_string):
     result = {"value": None, "label": None, "raw": stat_string}
 
     # match number with optional commas followed by label
-    match = re.match(r"([\d,]+)\s*(\w+)", stat_string)
+    match = STAT_PATTERN.match(stat_string)
     if match:
         num_str = match.group(1).replace(",", "")
         result["value"] = int(num_str)
@@ -107,13 +127,13 @@ def parse_runtime_string(runtime_str):
     runtime_str = runtime_str.lower().strip()
 
     # try "X mins" format
-    match = re.search(r"(\d+)\s*mins?", runtime_str)
+    match = RUNTIME_MINS_PATTERN.search(runtime_str)
     if match:
         return int(match.group(1))
 
     # try "Xh Ym" format
-    hours_match = re.search(r"(\d+)\s*h", runtime_str)
-    mins_match = re.search(r"(\d+)\s*m", runtime_str)
+    hours_match = RUNTIME_HOURS_PATTERN.search(runtime_str)
+    mins_match = RUNTIME_MINUTES_PATTERN.search(runtime_str)
     total = 0
     if hours_match:
         total += int(hours_match.group(1)) * 60
@@ -122,12 +142,15 @@ def parse_runtime_string(runtime_str):
     return total if total > 0 else None
 
 
-def extract_bio_links(target_url):
+def extract_bio_links(target_url, browser=None, standalone=False):
     """
     extracts links and social media accounts from user bio
 
     Args:
         target_url: letterboxd user profile URL
+        browser: browser to use if the page needs one (defaults to this thread's
+            pooled browser)
+        standalone: if True, launch a dedicated browser if the page needs one
 
     Returns:
         dict with extracted links and social accounts
@@ -141,57 +164,40 @@ def extract_bio_links(target_url):
         "bio_links": [],
     }
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        try:
-            page.goto(target_url)
+    try:
+        with page_loader(browser, standalone) as load:
+            doc = load(target_url)
             print(f"Success: Retrieved profile for bio links {target_url}")
-
-            # check for pro/patron badges
-            pro_badge = page.query_selector("span.badge.-pro")
-            if pro_badge:
-                result["letterboxd_pro"] = True
-            patron_badge = page.query_selector("span.badge.-patron")
-            if patron_badge:
-                result["letterboxd_patron"] = True
-
-            # extract website link
-            website_link = page.query_selector("a.icon-website")
-            if website_link:
-                result["website"] = website_link.get_attribute("href")
-
-            # extract twitter link
-            twitter_link = page.query_selector("a.icon-twitter")
-            if twitter_link:
-                href = twitter_link.get_attribute("href")
-                result["twitter"] = href
-                # extract username from URL
-                match = re.search(r"twitter\.com/(\w+)", href)
-                if match:
-                    result["twitter_username"] = match.group(1)
-
-            # extract all links from bio text
-            bio_section = page.query_selector("div.bio.js-bio")
-            if bio_section:
-                links = bio_section.query_selector_all("a")
-                for link in links:
-                    href = link.get_attribute("href")
-                    text = link.inner_text().strip()
-                    if href:
-                        link_data = {"url": href, "text": text}
-                        result["bio_links"].append(link_data)
-
-                        # detect instagram
-                        if "instagram.com" in href.lower():
-                            result["instagram"] = href
-                            match = re.search(r"instagram\.com/(\w+)", href)
-                            if match:
-                                result["instagram_username"] = match.group(1)
-
-        except Exception as e:
-            print(f"Error extracting bio links: {e}")
-        page.close()
-        browser.close()
+            profile = doc.extract(BIO_FIELDS)
+            links = doc.extract_all("div.bio.js-bio a", BIO_LINK_FIELDS)
+    except Exception as e:
+        print(f"Error extracting bio links: {e}")
+        return result
+
+    result["letterboxd_pro"] = profile["pro"]
+    result["letterboxd_patron"] = profile["patron"]
+    result["website"] = profile["website"]
+
+    href = profile["twitter"]
+    if href:
+        result["twitter"] = href
+        # extract username from URL
+        match = TWITTER_USERNAME_PATTERN.search(href)
+        if match:
+            result["twitter_username"] = match.group(1)
+
+    # links from bio text
+    for link in links:
+        href = link["url"]
+        if not href:
+            continue
+        result["bio_links"].append(link)
+
+        # detect instagram
+        if "instagram.com" in href.lower():
+            result["instagram"] = href
+            match = INSTAGRAM_USERNAME_PATTERN.search(href)
+            if match:
+                result["instagram_username"] = match.group(1)
 
     return result
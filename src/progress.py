@@ -1,11 +1,19 @@
 # ----- PROGRESS TRACKING -----
 
 import time
+import threading
+
+# routine "Processed x/y" updates are reported at most this often (seconds);
+# start, errors, completion and updates with a message are always reported
+MIN_NOTIFY_INTERVAL = 1 / 30
 
 
 class ProgressTracker:
     """
     tracks progress of long-running scraping operations with callbacks
+
+    update and error may be called from several worker threads; the callback is
+    invoked from whichever thread made the call, one call at a time.
     """
 
     def __init__(self, total=0, callback=None):
@@ -19,30 +27,38 @@ class ProgressTracker:
         self.callback = callback
         self.start_time = None
         self.errors = []
+        self._last_notify = 0.0
+        self._lock = threading.RLock()
 
     def start(self, total=None):
         """starts tracking progress"""
         if total is not None:
             self.total = total
         self.current = 0
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.errors = []
         self._notify(f"Starting operation with {self.total} items")
 
     def update(self, increment=1, message=None):
         """updates progress by increment"""
-        self.current += increment
-        msg = message or f"Processed {self.current}/{self.total}"
-        self._notify(msg)
+        with self._lock:
+            self.current += increment
+            now = time.monotonic()
+            if not message:
+                if now - self._last_notify < MIN_NOTIFY_INTERVAL and self.current < self.total:
+                    return
+                message = f"Processed {self.current}/{self.total}"
+            self._notify(message)
 
     def error(self, message):
         """records an error"""
-        self.errors.append(message)
-        self._notify(f"Error: {message}")
+        with self._lock:
+            self.errors.append(message)
+            self._notify(f"Error: {message}")
 
     def complete(self):
         """marks operation as complete"""
-        elapsed = time.time() - self.start_time if self.start_time else 0
+        elapsed = time.monotonic() - self.start_time if self.start_time else 0
         msg = f"Completed {self.current}/{self.total} in {elapsed:.1f}s"
         if self.errors:
             msg += f" ({len(self.errors)} errors)"
@@ -50,6 +66,7 @@ class ProgressTracker:
 
     def _notify(self, message):
         """calls the callback if set"""
+        self._last_notify = time.monotonic()
         if self.callback:
             self.callback(self.current, self.total, message)
         else:
@@ -67,7 +84,7 @@ class ProgressTracker:
         """returns elapsed time in seconds"""
         if self.start_time is None:
             return 0
-        return time.time() - self.start_time
+        return time.monotonic() - self.start_time
 
 
 def create_progress_bar_callback():
@@ -1,13 +1,247 @@
 # ----- SCRAPING FUNCTIONS -----
 
 import time
-from playwright.sync_api import sync_playwright
+import threading
+from datetime import datetime
+
+from .browser import scrape_page, scrape_many, wait_result, BrowserExecutor
+from .cache import cache_get, cache_set
+from .config import PAGE_LOAD_STATE
+from .fetcher import page_loader, iter_documents, extract_items
+
+# film pages rarely change, so their cached copies stay fresh longer
+FILM_PAGE_CACHE_TTL = 24 * 3600
+
+# parsed film records are reused for this long, so films that recur across users
+# skip both the fetch and the parse
+FILM_DETAILS_CACHE_TTL = 3 * 24 * 3600
+
+# threads that run scrape_letterboxd's watchlist and films scrapes next to the
+# profile scrape; each keeps its browser pool warm until it idles (see BrowserExecutor)
+SECTION_WORKERS = 8
+
+_section_executor = None
+_section_executor_lock = threading.Lock()
+
+# ----- FIELD SPECS -----
+# see FIELD EXTRACTION in fetcher.py for the (selector, kind, attr) format
+
+FILM_FIELDS = {
+    "title": ("section.film-header-group h1.headline-1", "text", None),
+    "year": ("section.film-header-group small.number a", "text", None),
+    "director": ("section.film-header-group span.directorlist a", "text", None),
+    "runtime": ("aside.sidebar p.text-link", "text", None),
+    "genres": ("div#tab-genres a.text-slug", "texts", None),
+    "average_rating": ("a.tooltip.display-rating", "text", None),
+    "tagline": ("h4.tagline", "text", None),
+    "description": ("div.truncate p", "text", None),
+}
+
+REVIEW_FIELDS = {
+    "film_name": ("div.film-poster", "attr", "data-film-name"),
+    "film_slug": ("div.film-poster", "attr", "data-film-slug"),
+    "rating": ("span.rating", "text", None),
+    "review_text": ("div.body-text", "text", None),
+    "review_date": ("span.date a", "text", None),
+    "liked": ("span.like.icon-liked", "exists", None),
+}
+
+DIARY_FIELDS = {
+    "film_name": ("td.td-film-details div.film-poster", "attr", "data-film-name"),
+    "film_slug": ("td.td-film-details div.film-poster", "attr", "data-film-slug"),
+    "watch_date": ("td.td-calendar a", "attr", "href"),
+    "rating": ("td.td-rating span.rating", "text", None),
+    "rewatch": ("td.td-rewatch span.icon-status-rewatch", "exists", None),
+    "liked": ("td.td-like span.icon-liked", "exists", None),
+    "has_review": ("td.td-review a.icon-review", "exists", None),
+}
+
+LIST_FIELDS = {
+    "list_name": ("h2.title a", "text", None),
+    "list_url": ("h2.title a", "attr", "href"),
+    "description": ("div.body-text p", "text", None),
+    "film_count": ("small.value", "text", None),
+}
+
+LIST_HEADER_FIELDS = {
+    "list_name": ("h1.title-1", "text", None),
+    "description": ("div.body-text", "text", None),
+}
+
+LIST_FILM_FIELDS = {
+    "film_name": (None, "attr", "data-film-name"),
+    "film_slug": (None, "attr", "data-film-slug"),
+    "film_poster_image": ("img", "attr", "src"),
+}
+
+PAGINATION_FIELDS = {
+    "pages": ("div.paginate-pages li.paginate-page", "texts", None),
+}
+
+POSTER_FIELDS = {
+    "film_name": (None, "attr", "data-film-name"),
+    "film_slug": (None, "attr", "data-film-slug"),
+    "film_poster_image": ("div img", "attr", "src"),
+}
+
+PROFILE_SUMMARY_SELECTOR = "div.profile-summary.js-profile-summary"
+
+# read relative to PROFILE_SUMMARY_SELECTOR
+PROFILE_SUMMARY_FIELDS = {
+    "user_profile_image": ("div.profile-avatar span img", "attr", "src"),
+    "user_name": (
+        "div.profile-name-and-actions.js-profile-name-and-actions h1.person-display-name span",
+        "text",
+        None,
+    ),
+    "user_bio": ("div.profile-info.js-profile-info div.bio.js-bio div", "text", None),
+    # value and label are read apart, the page only separates them with CSS
+    "user_statistics": (
+        "div.profile-info.js-profile-info div.profile-stats.js-profile-stats h4.profile-statistic",
+        "items",
+        {
+            "text": (None, "text", None),
+            "value": ("span.value", "text", None),
+            "definition": ("span.definition", "text", None),
+        },
+    ),
+}
+
+PROFILE_POSTER_FIELDS = {
+    "film_name": (None, "attr", "data-film-name"),
+    "film_poster_image": ("div img", "attr", "src"),
+}
+
+PROFILE_HEADER_SELECTOR = "div#content div.content-wrap section.profile-header.js-profile-header"
+
+# the whole profile page, read in one round trip
+PROFILE_FIELDS = {
+    "has_content": ("div#content div.content-wrap", "exists", None),
+    "has_header": (PROFILE_HEADER_SELECTOR, "exists", None),
+    "summaries": (PROFILE_SUMMARY_SELECTOR, "items", PROFILE_SUMMARY_FIELDS),
+    "has_favourites": ("section#favourites", "exists", None),
+    "favourites": (
+        "section#favourites ul.poster-list li.poster-container div.film-poster",
+        "items",
+        PROFILE_POSTER_FIELDS,
+    ),
+    "has_recent_activity": ("section#recent-activity", "exists", None),
+    "recent_activity": (
+        "section#recent-activity ul.poster-list li.poster-container div.film-poster",
+        "items",
+        PROFILE_POSTER_FIELDS,
+    ),
+}
+
+PERSON_FIELDS = {
+    "username": ("td.table-person h3.title-3 a", "attr", "href"),
+    "display_name": ("td.table-person h3.title-3 a", "text", None),
+    "profile_url": ("td.table-person h3.title-3 a", "attr", "href"),
+    "avatar_url": ("td.table-person a.avatar img", "attr", "src"),
+}
+
+
+def _page_url(base_url, page_number):
+    """builds the URL of a numbered page"""
+    if page_number == 1:
+        return base_url
+    return f"{base_url}page/{page_number}/"
+
+
+def _last_page_number(doc):
+    """reads the highest page number from the pagination links, or None without them"""
+    labels = doc.extract(PAGINATION_FIELDS)["pages"]
+    numbers = [int(label) for label in labels if label.isdigit()]
+    return max(numbers, default=None)
+
+
+def _iter_paginated(
+    base_url,
+    label,
+    item_selector,
+    fields,
+    paginate=True,
+    max_pages=50,
+    browser=None,
+    standalone=False,
+    on_first_page=None,
+):
+    """
+    yields the item_selector matches of base_url and its numbered pages, one list per page
+
+    The page count is read from the first page's pagination, so the last page
+    is known without probing for a.next. When the first page comes over plain
+    HTTP, the next DEFAULT_FETCH_WORKERS pages are fetched concurrently ahead of
+    the consumer (see iter_documents); pages that need a browser are loaded in
+    order.
+
+    Args:
+        base_url: first page URL, later pages are {base_url}page/N/
+        label: page name used in log messages
+        item_selector: CSS selector for one item
+        fields: field spec read from each item
+        paginate: whether to follow a.next links
+        max_pages: maximum number of pages to scrape
+        browser: browser to use if a page needs one
+        standalone: if True, launch a dedicated browser if a page needs one
+        on_first_page: optional callback receiving the first page document
+
+    Yields:
+        non-empty lists of dicts with one key per field
+    """
+    prefetched = iter_documents([])
+    last_page = None
+    with page_loader(browser, standalone) as load:
+        current_page = 1
+        try:
+            while True:
+                page_url = _page_url(base_url, current_page)
+                doc = next(prefetched, None) or load(page_url)
+                print(f"Success: Retrieved {label} page {page_url}")
+
+                if current_page == 1:
+                    if on_first_page:
+                        on_first_page(doc)
+                    if paginate:
+                        last_page = _last_page_number(doc)
+                    if last_page and not doc.via_browser:
+                        page_numbers = range(2, min(last_page, max_pages) + 1)
+                        prefetched = iter_documents([_page_url(base_url, n) for n in page_numbers])
+
+                items = doc.extract_all(item_selector, fields)
+                if not items:
+                    break
+                yield items
+
+                if not paginate:
+                    break
+
+                if last_page is not None:
+                    has_next = current_page < last_page
+                else:
+                    has_next = doc.exists("a.next")
+                if not has_next or current_page >= max_pages:
+                    break
+                current_page += 1
+
+        except Exception as e:
+            print(f"Error: Unable to process {label} page {current_page}: {e}")
+        finally:
+            prefetched.close()
 
 
-def scrape_film_details(film_slug):
+def scrape_film_details(film_slug, browser=None, standalone=False, use_cache=True):
     """
     scrapes detailed information for a specific film from letterboxd
+
+    Records are cached by slug for FILM_DETAILS_CACHE_TTL unless use_cache is False.
     """
+    cache_key = f"film:{film_slug}"
+    if use_cache:
+        cached = cache_get(cache_key, ttl=FILM_DETAILS_CACHE_TTL)
+        if cached:
+            return cached
+
     film_url = f"https://letterboxd.com/film/{film_slug}/"
     film_details = {
         "film_slug": film_slug,
@@ -20,665 +254,328 @@ def scrape_film_details(film_slug):
         "tagline": None,
         "description": None,
     }
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+    with page_loader(browser, standalone) as load:
         try:
-            page.goto(film_url)
+            doc = load(film_url, cache_ttl=FILM_PAGE_CACHE_TTL)
             print(f"Success: Retrieved film page {film_url}")
 
-            header = page.query_selector("section.film-header-group")
-            if header:
-                title_el = header.query_selector("h1.headline-1")
-                if title_el:
-                    film_details["title"] = title_el.inner_text().strip()
-                year_el = header.query_selector("small.number a")
-                if year_el:
-                    film_details["year"] = year_el.inner_text().strip()
-                director_el = header.query_selector("span.directorlist a")
-                if director_el:
-                    film_details["director"] = director_el.inner_text().strip()
-
-            tagline_el = page.query_selector("h4.tagline")
-            if tagline_el:
-                film_details["tagline"] = tagline_el.inner_text().strip()
-
-            desc_el = page.query_selector("div.truncate p")
-            if desc_el:
-                film_details["description"] = desc_el.inner_text().strip()
-
-            sidebar = page.query_selector("aside.sidebar")
-            if sidebar:
-                runtime_el = sidebar.query_selector("p.text-link")
-                if runtime_el:
-                    runtime_text = runtime_el.inner_text().strip()
-                    if "mins" in runtime_text.lower():
-                        film_details["runtime"] = runtime_text
-
-            genre_els = page.query_selector_all("div#tab-genres a.text-slug")
-            film_details["genres"] = [g.inner_text().strip() for g in genre_els]
-
-            rating_el = page.query_selector("a.tooltip.display-rating")
-            if rating_el:
-                rating_text = rating_el.inner_text().strip()
-                film_details["average_rating"] = rating_text
+            film_details.update(doc.extract(FILM_FIELDS))
+            runtime = film_details["runtime"]
+            if runtime and "mins" not in runtime.lower():
+                film_details["runtime"] = None
 
         except Exception as e:
             print(f"Error: Unable to process film {film_slug}: {e}")
-        page.close()
-        browser.close()
 
+    # only complete scrapes are worth keeping
+    if use_cache and film_details["title"]:
+        cache_set(cache_key, film_details)
     return film_details
 
 
-def scrape_user_reviews(target_url, paginate=True, max_pages=50):
+def scrape_film_details_batch(film_slugs, workers=4):
     """
-    scrapes user's film reviews with ratings from letterboxd
-    """
-    base_reviews_url = f"{target_url}films/reviews/"
-    reviews_array = []
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        current_page = 1
-        try:
-            while True:
-                if current_page == 1:
-                    page_url = base_reviews_url
-                else:
-                    page_url = f"{base_reviews_url}page/{current_page}/"
-                page.goto(page_url)
-                print(f"Success: Retrieved reviews page {page_url}")
+    scrapes several films concurrently, see scrape_many
 
-                review_items = page.query_selector_all("li.film-detail")
-                if not review_items:
-                    break
-
-                for item in review_items:
-                    review_data = {
-                        "film_name": None,
-                        "film_slug": None,
-                        "rating": None,
-                        "review_text": None,
-                        "review_date": None,
-                        "liked": False,
-                    }
-
-                    poster = item.query_selector("div.film-poster")
-                    if poster:
-                        review_data["film_name"] = poster.get_attribute("data-film-name")
-                        review_data["film_slug"] = poster.get_attribute("data-film-slug")
-
-                    rating_el = item.query_selector("span.rating")
-                    if rating_el:
-                        review_data["rating"] = rating_el.inner_text().strip()
-
-                    review_body = item.query_selector("div.body-text")
-                    if review_body:
-                        review_data["review_text"] = review_body.inner_text().strip()
-
-                    date_el = item.query_selector("span.date a")
-                    if date_el:
-                        review_data["review_date"] = date_el.inner_text().strip()
-
-                    like_el = item.query_selector("span.like.icon-liked")
-                    if like_el:
-                        review_data["liked"] = True
+    Cached records are returned without a fetch and repeated slugs are scraped once.
 
-                    reviews_array.append(review_data)
-
-                if not paginate:
-                    break
-
-                next_link = page.query_selector("a.next")
-                if not next_link or current_page >= max_pages:
-                    break
-                current_page += 1
+    Returns:
+        list of film detail dicts in film_slugs order, None where a scrape raised
+    """
+    unique_slugs = list(dict.fromkeys(film_slugs))
+    results = scrape_many(scrape_film_details, [(slug,) for slug in unique_slugs], workers)
+    by_slug = dict(zip(unique_slugs, results))
+    return [by_slug[slug] for slug in film_slugs]
 
-        except Exception as e:
-            print(f"Error: Unable to process reviews page {current_page}: {e}")
-        page.close()
-        browser.close()
 
-    return reviews_array
+def iter_user_reviews(target_url, paginate=True, max_pages=50, browser=None, standalone=False):
+    """
+    yields user's film reviews with ratings from letterboxd, one list per page
+    """
+    return _iter_paginated(
+        f"{target_url}films/reviews/",
+        "reviews",
+        "li.film-detail",
+        REVIEW_FIELDS,
+        paginate,
+        max_pages,
+        browser,
+        standalone,
+    )
+
+
+def scrape_user_reviews(target_url, paginate=True, max_pages=50, browser=None, standalone=False):
+    """
+    scrapes user's film reviews with ratings from letterboxd
+    """
+    pages = iter_user_reviews(target_url, paginate, max_pages, browser, standalone)
+    return [review for page in pages for review in page]
 
 
-def scrape_user_diary(target_url, paginate=True, max_pages=100):
+def iter_user_diary(target_url, paginate=True, max_pages=100, browser=None, standalone=False):
+    """
+    yields user's film diary entries from letterboxd, one list per page
+    """
+    return _iter_paginated(
+        f"{target_url}films/diary/",
+        "diary",
+        "tr.diary-entry-row",
+        DIARY_FIELDS,
+        paginate,
+        max_pages,
+        browser,
+        standalone,
+    )
+
+
+def scrape_user_diary(target_url, paginate=True, max_pages=100, browser=None, standalone=False):
     """
     scrapes user's film diary with watch dates and rewatch info from letterboxd
     """
-    base_diary_url = f"{target_url}films/diary/"
-    diary_entries = []
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        current_page = 1
-        try:
-            while True:
-                if current_page == 1:
-                    page_url = base_diary_url
-                else:
-                    page_url = f"{base_diary_url}page/{current_page}/"
-                page.goto(page_url)
-                print(f"Success: Retrieved diary page {page_url}")
-
-                entries = page.query_selector_all("tr.diary-entry-row")
-                if not entries:
-                    break
-
-                for entry in entries:
-                    entry_data = {
-                        "film_name": None,
-                        "film_slug": None,
-                        "watch_date": None,
-                        "rating": None,
-                        "rewatch": False,
-                        "liked": False,
-                        "has_review": False,
-                    }
-
-                    poster = entry.query_selector("td.td-film-details div.film-poster")
-                    if poster:
-                        entry_data["film_name"] = poster.get_attribute("data-film-name")
-                        entry_data["film_slug"] = poster.get_attribute("data-film-slug")
-
-                    date_el = entry.query_selector("td.td-calendar a")
-                    if date_el:
-                        entry_data["watch_date"] = date_el.get_attribute("href")
-
-                    rating_el = entry.query_selector("td.td-rating span.rating")
-                    if rating_el:
-                        entry_data["rating"] = rating_el.inner_text().strip()
-
-                    rewatch_el = entry.query_selector("td.td-rewatch span.icon-status-rewatch")
-                    if rewatch_el:
-                        entry_data["rewatch"] = True
-
-                    like_el = entry.query_selector("td.td-like span.icon-liked")
-                    if like_el:
-                        entry_data["liked"] = True
-
-                    review_el = entry.query_selector("td.td-review a.icon-review")
-                    if review_el:
-                        entry_data["has_review"] = True
-
-                    diary_entries.append(entry_data)
-
-                if not paginate:
-                    break
-
-                next_link = page.query_selector("a.next")
-                if not next_link or current_page >= max_pages:
-                    break
-                current_page += 1
-
-        except Exception as e:
-            print(f"Error: Unable to process diary page {current_page}: {e}")
-        page.close()
-        browser.close()
-
-    return diary_entries
+    pages = iter_user_diary(target_url, paginate, max_pages, browser, standalone)
+    return [entry for page in pages for entry in page]
 
 
-def scrape_user_lists(target_url, paginate=True, max_pages=20):
+def iter_user_lists(target_url, paginate=True, max_pages=20, browser=None, standalone=False):
+    """
+    yields all lists created by a user from letterboxd, one list per page
+    """
+    return _iter_paginated(
+        f"{target_url}lists/",
+        "lists",
+        "section.list-set",
+        LIST_FIELDS,
+        paginate,
+        max_pages,
+        browser,
+        standalone,
+    )
+
+
+def scrape_user_lists(target_url, paginate=True, max_pages=20, browser=None, standalone=False):
     """
     scrapes all lists created by a user from letterboxd
     """
-    base_lists_url = f"{target_url}lists/"
-    lists_array = []
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        current_page = 1
-        try:
-            while True:
-                if current_page == 1:
-                    page_url = base_lists_url
-                else:
-                    page_url = f"{base_lists_url}page/{current_page}/"
-                page.goto(page_url)
-                print(f"Success: Retrieved lists page {page_url}")
-
-                list_items = page.query_selector_all("section.list-set")
-                if not list_items:
-                    break
-
-                for item in list_items:
-                    list_data = {
-                        "list_name": None,
-                        "list_url": None,
-                        "description": None,
-                        "film_count": None,
-                    }
-
-                    title_el = item.query_selector("h2.title a")
-                    if title_el:
-                        list_data["list_name"] = title_el.inner_text().strip()
-                        list_data["list_url"] = title_el.get_attribute("href")
-
-                    desc_el = item.query_selector("div.body-text p")
-                    if desc_el:
-                        list_data["description"] = desc_el.inner_text().strip()
-
-                    count_el = item.query_selector("small.value")
-                    if count_el:
-                        list_data["film_count"] = count_el.inner_text().strip()
+    pages = iter_user_lists(target_url, paginate, max_pages, browser, standalone)
+    return [user_list for page in pages for user_list in page]
 
-                    lists_array.append(list_data)
 
-                if not paginate:
-                    break
+def iter_list_contents(
+    list_url, paginate=True, max_pages=50, browser=None, standalone=False, on_header=None
+):
+    """
+    yields all films from a specific letterboxd list, one list per page
 
-                next_link = page.query_selector("a.next")
-                if not next_link or current_page >= max_pages:
-                    break
-                current_page += 1
+    Args:
+        on_header: optional callback receiving the list's header fields (name,
+            description, ...) read from the first page
+    """
+    full_url = f"https://letterboxd.com{list_url}" if list_url.startswith("/") else list_url
 
-        except Exception as e:
-            print(f"Error: Unable to process lists page {current_page}: {e}")
-        page.close()
-        browser.close()
+    def read_header(doc):
+        if on_header:
+            on_header(doc.extract(LIST_HEADER_FIELDS))
 
-    return lists_array
+    return _iter_paginated(
+        full_url,
+        "list",
+        "li.poster-container div.film-poster",
+        LIST_FILM_FIELDS,
+        paginate,
+        max_pages,
+        browser,
+        standalone,
+        on_first_page=read_header,
+    )
 
 
-def scrape_list_contents(list_url, paginate=True, max_pages=50):
+def scrape_list_contents(list_url, paginate=True, max_pages=50, browser=None, standalone=False):
     """
     scrapes all films from a specific letterboxd list
     """
-    full_url = f"https://letterboxd.com{list_url}" if list_url.startswith("/") else list_url
     list_contents = {
         "list_url": list_url,
         "films": [],
     }
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        current_page = 1
-        try:
-            while True:
-                if current_page == 1:
-                    page_url = full_url
-                else:
-                    page_url = f"{full_url}page/{current_page}/"
-                page.goto(page_url)
-                print(f"Success: Retrieved list page {page_url}")
-
-                title_el = page.query_selector("h1.title-1")
-                if title_el and current_page == 1:
-                    list_contents["list_name"] = title_el.inner_text().strip()
-
-                desc_el = page.query_selector("div.body-text")
-                if desc_el and current_page == 1:
-                    list_contents["description"] = desc_el.inner_text().strip()
-
-                posters = page.query_selector_all("li.poster-container")
-                if not posters:
-                    break
-
-                for poster in posters:
-                    film_div = poster.query_selector("div.film-poster")
-                    if film_div:
-                        film_data = {
-                            "film_name": film_div.get_attribute("data-film-name"),
-                            "film_slug": film_div.get_attribute("data-film-slug"),
-                        }
-                        img = poster.query_selector("img")
-                        if img:
-                            film_data["film_poster_image"] = img.get_attribute("src")
-                        list_contents["films"].append(film_data)
 
-                if not paginate:
-                    break
-
-                next_link = page.query_selector("a.next")
-                if not next_link or current_page >= max_pages:
-                    break
-                current_page += 1
-
-        except Exception as e:
-            print(f"Error: Unable to process list page {current_page}: {e}")
-        page.close()
-        browser.close()
+    def read_header(header):
+        list_contents.update({key: value for key, value in header.items() if value is not None})
 
+    pages = iter_list_contents(list_url, paginate, max_pages, browser, standalone, read_header)
+    list_contents["films"] = [film for page in pages for film in page]
     return list_contents
 
 
-def scrape_user_followers(target_url, paginate=True, max_pages=50):
+def _iter_people(target_url, label, paginate, max_pages, browser, standalone):
     """
-    scrapes user's followers list from letterboxd
+    yields a followers or following table one list per page, deriving usernames
+    from profile links
     """
-    base_followers_url = f"{target_url}followers/"
-    followers_array = []
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        current_page = 1
-        try:
-            while True:
-                if current_page == 1:
-                    page_url = base_followers_url
-                else:
-                    page_url = f"{base_followers_url}page/{current_page}/"
-                page.goto(page_url)
-                print(f"Success: Retrieved followers page {page_url}")
-
-                follower_items = page.query_selector_all("table.person-table tr")
-                if not follower_items:
-                    break
-
-                for item in follower_items:
-                    user_data = {
-                        "username": None,
-                        "display_name": None,
-                        "profile_url": None,
-                        "avatar_url": None,
-                    }
-
-                    avatar = item.query_selector("td.table-person a.avatar img")
-                    if avatar:
-                        user_data["avatar_url"] = avatar.get_attribute("src")
-
-                    name_link = item.query_selector("td.table-person h3.title-3 a")
-                    if name_link:
-                        user_data["display_name"] = name_link.inner_text().strip()
-                        user_data["profile_url"] = name_link.get_attribute("href")
-                        if user_data["profile_url"]:
-                            user_data["username"] = user_data["profile_url"].strip("/")
-
-                    followers_array.append(user_data)
+    pages = _iter_paginated(
+        f"{target_url}{label}/",
+        label,
+        "table.person-table tr",
+        PERSON_FIELDS,
+        paginate,
+        max_pages,
+        browser,
+        standalone,
+    )
+    for people in pages:
+        for person in people:
+            if person["username"]:
+                person["username"] = person["username"].strip("/")
+        yield people
+
+
+def iter_user_followers(target_url, paginate=True, max_pages=50, browser=None, standalone=False):
+    """
+    yields user's followers list from letterboxd, one list per page
+    """
+    return _iter_people(target_url, "followers", paginate, max_pages, browser, standalone)
 
-                if not paginate:
-                    break
 
-                next_link = page.query_selector("a.next")
-                if not next_link or current_page >= max_pages:
-                    break
-                current_page += 1
+def scrape_user_followers(target_url, paginate=True, max_pages=50, browser=None, standalone=False):
+    """
+    scrapes user's followers list from letterboxd
+    """
+    pages = iter_user_followers(target_url, paginate, max_pages, browser, standalone)
+    return [person for page in pages for person in page]
 
-        except Exception as e:
-            print(f"Error: Unable to process followers page {current_page}: {e}")
-        page.close()
-        browser.close()
 
-    return followers_array
+def iter_user_following(target_url, paginate=True, max_pages=50, browser=None, standalone=False):
+    """
+    yields user's following list from letterboxd, one list per page
+    """
+    return _iter_people(target_url, "following", paginate, max_pages, browser, standalone)
 
 
-def scrape_user_following(target_url, paginate=True, max_pages=50):
+def scrape_user_following(target_url, paginate=True, max_pages=50, browser=None, standalone=False):
     """
     scrapes user's following list from letterboxd
     """
-    base_following_url = f"{target_url}following/"
-    following_array = []
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        current_page = 1
-        try:
-            while True:
-                if current_page == 1:
-                    page_url = base_following_url
-                else:
-                    page_url = f"{base_following_url}page/{current_page}/"
-                page.goto(page_url)
-                print(f"Success: Retrieved following page {page_url}")
-
-                following_items = page.query_selector_all("table.person-table tr")
-                if not following_items:
-                    break
-
-                for item in following_items:
-                    user_data = {
-                        "username": None,
-                        "display_name": None,
-                        "profile_url": None,
-                        "avatar_url": None,
-                    }
+    pages = iter_user_following(target_url, paginate, max_pages, browser, standalone)
+    return [person for page in pages for person in page]
 
-                    avatar = item.query_selector("td.table-person a.avatar img")
-                    if avatar:
-                        user_data["avatar_url"] = avatar.get_attribute("src")
 
-                    name_link = item.query_selector("td.table-person h3.title-3 a")
-                    if name_link:
-                        user_data["display_name"] = name_link.inner_text().strip()
-                        user_data["profile_url"] = name_link.get_attribute("href")
-                        if user_data["profile_url"]:
-                            user_data["username"] = user_data["profile_url"].strip("/")
-
-                    following_array.append(user_data)
-
-                if not paginate:
-                    break
-
-                next_link = page.query_selector("a.next")
-                if not next_link or current_page >= max_pages:
-                    break
-                current_page += 1
-
-        except Exception as e:
-            print(f"Error: Unable to process following page {current_page}: {e}")
-        page.close()
-        browser.close()
-
-    return following_array
-
-
-def scrape_letterboxd_user_watchlist(target_url, paginate=True, max_pages=50):
+def iter_letterboxd_user_watchlist(
+    target_url, paginate=True, max_pages=50, browser=None, standalone=False
+):
+    """
+    yields a user's watchlist from letterboxd, one list per page
+    """
+    return _iter_paginated(
+        f"{target_url}watchlist/",
+        "watchlist",
+        "ul.poster-list li.poster-container div.film-poster",
+        POSTER_FIELDS,
+        paginate,
+        max_pages,
+        browser,
+        standalone,
+    )
+
+
+def scrape_letterboxd_user_watchlist(
+    target_url, paginate=True, max_pages=50, browser=None, standalone=False
+):
     """
     scrapes a user's watchlist from letterboxd
     """
-    base_watchlist_url = f"{target_url}watchlist/"
-    watchlist_array = []
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        current_page = 1
-        try:
-            while True:
-                if current_page == 1:
-                    page_url = base_watchlist_url
-                else:
-                    page_url = f"{base_watchlist_url}page/{current_page}/"
-                page.goto(page_url)
-                print(f"Success: Retrieved watchlist page {page_url}")
-
-                poster_containers = page.query_selector_all("ul.poster-list li.poster-container")
-                if not poster_containers:
-                    break
-
-                for container in poster_containers:
-                    film_poster = container.query_selector("div.film-poster")
-                    if film_poster:
-                        film_name = film_poster.get_attribute("data-film-name")
-                        film_slug = film_poster.get_attribute("data-film-slug")
-                        img = container.query_selector("div.film-poster div img")
-                        film_poster_image = img.get_attribute("src") if img else None
-                        watchlist_array.append(
-                            {
-                                "film_name": film_name,
-                                "film_slug": film_slug,
-                                "film_poster_image": film_poster_image,
-                            }
-                        )
-
-                if not paginate:
-                    break
-
-                next_link = page.query_selector("a.next")
-                if not next_link or current_page >= max_pages:
-                    break
-                current_page += 1
-
-        except Exception as e:
-            print(f"Error: Unable to process watchlist page {current_page}: {e}")
-        page.close()
-        browser.close()
+    pages = iter_letterboxd_user_watchlist(target_url, paginate, max_pages, browser, standalone)
+    return [film for page in pages for film in page]
 
-    return watchlist_array
 
-
-def scrape_letterboxd_user_films(target_url, paginate=True, max_pages=100):
+def iter_letterboxd_user_films(
+    target_url, paginate=True, max_pages=100, browser=None, standalone=False
+):
+    """
+    yields all films watched by a user from letterboxd, one list per page
+    """
+    return _iter_paginated(
+        f"{target_url}films/",
+        "films",
+        "ul.poster-list li.poster-container div.film-poster",
+        POSTER_FIELDS,
+        paginate,
+        max_pages,
+        browser,
+        standalone,
+    )
+
+
+def scrape_letterboxd_user_films(
+    target_url, paginate=True, max_pages=100, browser=None, standalone=False
+):
     """
     scrapes all films watched by a user from letterboxd
     """
-    base_films_url = f"{target_url}films/"
-    films_array = []
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        current_page = 1
-        try:
-            while True:
-                if current_page == 1:
-                    page_url = base_films_url
-                else:
-                    page_url = f"{base_films_url}page/{current_page}/"
-                page.goto(page_url)
-                print(f"Success: Retrieved films page {page_url}")
-
-                poster_containers = page.query_selector_all("ul.poster-list li.poster-container")
-                if not poster_containers:
-                    break
+    pages = iter_letterboxd_user_films(target_url, paginate, max_pages, browser, standalone)
+    return [film for page in pages for film in page]
 
-                for container in poster_containers:
-                    film_poster = container.query_selector("div.film-poster")
-                    if film_poster:
-                        film_name = film_poster.get_attribute("data-film-name")
-                        film_slug = film_poster.get_attribute("data-film-slug")
-                        img = container.query_selector("div.film-poster div img")
-                        film_poster_image = img.get_attribute("src") if img else None
-                        films_array.append(
-                            {
-                                "film_name": film_name,
-                                "film_slug": film_slug,
-                                "film_poster_image": film_poster_image,
-                            }
-                        )
 
-                if not paginate:
-                    break
+def _format_duration(seconds):
+    """formats elapsed seconds as HH:MM:SS"""
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
-                next_link = page.query_selector("a.next")
-                if not next_link or current_page >= max_pages:
-                    break
-                current_page += 1
-
-        except Exception as e:
-            print(f"Error: Unable to process films page {current_page}: {e}")
-        page.close()
-        browser.close()
 
-    return films_array
+def _statistic_text(stat):
+    """joins a profile statistic's value and label, e.g. "1,234 films" """
+    if stat["value"] and stat["definition"]:
+        return f"{stat['value']} {stat['definition']}"
+    return stat["text"] or ""
 
 
-def scrape_letterboxd_user(target_url):
+def scrape_letterboxd_user(target_url, browser=None, standalone=False):
     """
     scrapes user profile data from letterboxd
     """
     user_data = None
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        start_time = time.time()
+    with scrape_page(browser, standalone) as page:
+        start_time = time.monotonic()
         try:
-            page.goto(target_url)
+            page.goto(target_url, wait_until=PAGE_LOAD_STATE)
             print(f"Success: Retrieved profile {target_url}")
 
-            main_div = page.wait_for_selector("div#content div.content-wrap")
-            if not main_div:
+            profile = extract_items(page, None, PROFILE_FIELDS)
+            if not profile["has_content"]:
                 print("Error: Main content not found!")
                 return None
-
-            user_profile_header = main_div.wait_for_selector(
-                "section.profile-header.js-profile-header"
-            )
-            if not user_profile_header:
+            if not profile["has_header"]:
                 print("Error: User profile header not found!")
                 return None
 
-            # extract profile image
-            user_profile_image_el = page.query_selector(
-                "div.profile-summary.js-profile-summary div.profile-avatar span img"
-            )
-            user_profile_image = (
-                user_profile_image_el.get_attribute("src") if user_profile_image_el else None
-            )
-
-            # extract display name
-            user_name_el = page.query_selector(
-                "div.profile-summary.js-profile-summary div.profile-name-and-actions.js-profile-name-and-actions h1.person-display-name span"
-            )
-            user_name = user_name_el.inner_text().strip() if user_name_el else None
+            if profile["summaries"]:
+                summary = profile["summaries"][0]
+            else:
+                summary = dict.fromkeys(PROFILE_SUMMARY_FIELDS)
+                summary["user_statistics"] = []
+            user_profile_image = summary["user_profile_image"]
+            user_name = summary["user_name"]
+            user_bio = summary["user_bio"]
+            user_statistics_array = summary["user_statistics"]
 
             # extract username from URL or data attribute
             user_data_person = target_url.rstrip("/").split("/")[-1]
 
-            # extract bio
-            user_bio_el = page.query_selector(
-                "div.profile-summary.js-profile-summary div.profile-info.js-profile-info div.bio.js-bio div"
-            )
-            user_bio = user_bio_el.inner_text().strip() if user_bio_el else None
-
-            # extract statistics
-            user_statistics_array = []
-            stat_elements = page.query_selector_all(
-                "div.profile-summary.js-profile-summary div.profile-info.js-profile-info div.profile-stats.js-profile-stats h4.profile-statistic"
-            )
-            for stat in stat_elements:
-                user_statistics_array.append(stat.inner_text().strip())
-
-            # extract favourite films
-            user_favourite_films_array = []
-            user_favourites = main_div.query_selector("section#favourites")
-            if user_favourites:
-                print("Success: User favourite films found!")
-                for film in user_favourites.query_selector_all(
-                    "ul.poster-list li.poster-container"
-                ):
-                    film_poster = film.query_selector("div.film-poster")
-                    if film_poster:
-                        film_name = film_poster.get_attribute("data-film-name")
-                        img = film.query_selector("div.film-poster div img")
-                        film_poster_image = img.get_attribute("src") if img else None
-                        user_favourite_films_array.append(
-                            {
-                                "film_name": film_name,
-                                "film_poster_image": film_poster_image,
-                            }
-                        )
-            else:
-                print("Error: User favourite films not found!")
-
-            # extract recent activity
-            user_recent_activity_array = []
-            user_recent_activity = main_div.query_selector("section#recent-activity")
-            if user_recent_activity:
-                print("Success: User recent activity found!")
-                for film in user_recent_activity.query_selector_all(
-                    "ul.poster-list li.poster-container"
-                ):
-                    film_poster = film.query_selector("div.film-poster")
-                    if film_poster:
-                        film_name = film_poster.get_attribute("data-film-name")
-                        img = film.query_selector("div.film-poster div img")
-                        film_poster_image = img.get_attribute("src") if img else None
-                        user_recent_activity_array.append(
-                            {
-                                "film_name": film_name,
-                                "film_poster_image": film_poster_image,
-                            }
-                        )
-            else:
-                print("Error: User recent activity not found!")
+            for label, found in (
+                ("favourite films", profile["has_favourites"]),
+                ("recent activity", profile["has_recent_activity"]),
+            ):
+                if found:
+                    print(f"Success: User {label} found!")
+                else:
+                    print(f"Error: User {label} not found!")
+            user_favourite_films_array = profile["favourites"]
+            user_recent_activity_array = profile["recent_activity"]
 
             user_data = {
                 "metadata": {
-                    "date_time": time.strftime("%Y-%m-%d %H:%M:%S"),
+                    "date_time": datetime.now().isoformat(sep=" ", timespec="seconds"),
                     "target_url": target_url,
-                    "duration": time.strftime(
-                        "%H:%M:%S", time.gmtime(time.time() - start_time)
-                    ),
+                    "duration": _format_duration(time.monotonic() - start_time),
                 },
                 "scraped_data": {
                     "profile": {
@@ -686,7 +583,7 @@ def scrape_letterboxd_user(target_url):
                         "user_data_person": user_data_person,
                         "user_bio": user_bio,
                         "user_statistics": [
-                            " ".join(el.split("\n")).lower()
+                            _statistic_text(el).replace("\n", " ").lower()
                             for el in user_statistics_array
                         ],
                         "user_profile_image": user_profile_image,
@@ -701,18 +598,50 @@ def scrape_letterboxd_user(target_url):
 
         except Exception as e:
             print(f"Error: Unable to process {target_url}: {e}")
-        page.close()
-        browser.close()
     return user_data
 
 
-def scrape_letterboxd(target_url, paginate=True):
+def _get_section_executor():
+    """gets or creates the shared executor for scrape_letterboxd sections"""
+    global _section_executor
+    with _section_executor_lock:
+        if _section_executor is None:
+            _section_executor = BrowserExecutor(
+                max_workers=SECTION_WORKERS, thread_name_prefix="bumi-section"
+            )
+    return _section_executor
+
+
+def close_section_executor():
+    """stops the scrape_letterboxd section threads, closing their browser pools"""
+    global _section_executor
+    with _section_executor_lock:
+        executor, _section_executor = _section_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+def scrape_letterboxd(target_url, paginate=True, browser=None, standalone=False):
     """
     wrapper function for user interfacing
+
+    The profile, watchlist and films are scraped concurrently, except when a
+    browser is passed in (it can only be driven from the calling thread).
     """
-    buffer = scrape_letterboxd_user(target_url)
-    watchlist = scrape_letterboxd_user_watchlist(target_url, paginate=paginate)
-    all_films = scrape_letterboxd_user_films(target_url, paginate=paginate)
+    section_kwargs = {"paginate": paginate, "browser": browser, "standalone": standalone}
+    if browser is None:
+        executor = _get_section_executor()
+        watchlist_future = executor.submit(
+            scrape_letterboxd_user_watchlist, target_url, **section_kwargs
+        )
+        films_future = executor.submit(scrape_letterboxd_user_films, target_url, **section_kwargs)
+        buffer = scrape_letterboxd_user(target_url, standalone=standalone)
+        watchlist = wait_result(watchlist_future)
+        all_films = wait_result(films_future)
+    else:
+        buffer = scrape_letterboxd_user(target_url, browser=browser, standalone=standalone)
+        watchlist = scrape_letterboxd_user_watchlist(target_url, **section_kwargs)
+        all_films = scrape_letterboxd_user_films(target_url, **section_kwargs)
     if watchlist:
         buffer["scraped_data"]["films"]["watchlist"] = watchlist
     if all_films:
@@ -1,16 +1,62 @@
 # ----- FILM SEARCH -----
 
 import urllib.parse
-from playwright.sync_api import sync_playwright
 
-
-def search_films(query, max_results=20):
+from .browser import scrape_page, scrape_many
+from .config import PAGE_LOAD_STATE, safe_wait_for_selector
+from .fetcher import page_loader, extract_items, PAGE_CACHE_TTL
+
+# how long to wait for the activity feed's rows to be rendered (milliseconds)
+ACTIVITY_WAIT_TIMEOUT = 5000
+
+# popular films and popular reviews move slowly, so their pages are cached
+# longer than the default PAGE_CACHE_TTL
+POPULAR_PAGE_CACHE_TTL = 24 * 3600
+
+# ----- FIELD SPECS -----
+# see FIELD EXTRACTION in fetcher.py for the (selector, kind, attr) format
+
+SEARCH_RESULT_FIELDS = {
+    "title": ("h2.headline-2 a", "text", None),
+    "year": ("h2.headline-2 small a", "text", None),
+    "film_slug": ("div.film-poster", "attr", "data-film-slug"),
+    "director": ("p.film-detail-content a", "text", None),
+    "poster_url": ("div.film-poster img", "attr", "src"),
+}
+
+POSTER_RESULT_FIELDS = {
+    "title": ("div.film-poster", "attr", "data-film-name"),
+    "film_slug": ("div.film-poster", "attr", "data-film-slug"),
+    "poster_url": ("img", "attr", "src"),
+}
+
+ACTIVITY_FIELDS = {
+    "user": ("a.avatar", "attr", "href"),
+    "film_name": ("div.film-poster", "attr", "data-film-name"),
+    "film_slug": ("div.film-poster", "attr", "data-film-slug"),
+    "rating": ("span.rating", "text", None),
+    "review": ("div.body-text", "text", None),
+}
+
+POPULAR_REVIEW_FIELDS = {
+    "user": ("a.avatar", "attr", "href"),
+    "rating": ("span.rating", "text", None),
+    "review_text": ("div.body-text", "text", None),
+    "date": ("span.date a", "text", None),
+}
+
+
+def search_films(query, max_results=20, browser=None, standalone=False, use_cache=True):
     """
     searches letterboxd for films by title
 
     Args:
         query: search query string
         max_results: maximum number of results to return
+        browser: browser to use if the page needs one (defaults to this thread's pooled browser)
+        standalone: if True, launch a dedicated browser if the page needs one
+        use_cache: if False, the page is fetched again instead of served from the
+            page cache
 
     Returns:
         list of film results with title, year, slug, and poster
@@ -19,57 +65,37 @@ def search_films(query, max_results=20):
     search_url = f"https://letterboxd.com/search/films/{encoded_query}/"
     results = []
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+    with page_loader(browser, standalone) as load:
         try:
-            page.goto(search_url)
+            doc = load(search_url, cache_ttl=PAGE_CACHE_TTL if use_cache else 0)
             print(f"Success: Searching for '{query}'")
 
-            film_results = page.query_selector_all("ul.results li.film-detail")
-
-            for i, item in enumerate(film_results):
-                if i >= max_results:
-                    break
-
-                film_data = {
-                    "title": None,
-                    "year": None,
-                    "film_slug": None,
-                    "director": None,
-                    "poster_url": None,
-                }
+            items = doc.extract_all("ul.results li.film-detail", SEARCH_RESULT_FIELDS)
+            results = items[:max_results]
 
-                poster = item.query_selector("div.film-poster")
-                if poster:
-                    film_data["film_slug"] = poster.get_attribute("data-film-slug")
-                    img = poster.query_selector("img")
-                    if img:
-                        film_data["poster_url"] = img.get_attribute("src")
-
-                title_el = item.query_selector("h2.headline-2 a")
-                if title_el:
-                    film_data["title"] = title_el.inner_text().strip()
+        except Exception as e:
+            print(f"Error searching for '{query}': {e}")
 
-                year_el = item.query_selector("h2.headline-2 small a")
-                if year_el:
-                    film_data["year"] = year_el.inner_text().strip()
+    return results
 
-                director_el = item.query_selector("p.film-detail-content a")
-                if director_el:
-                    film_data["director"] = director_el.inner_text().strip()
 
-                results.append(film_data)
+def search_films_batch(queries, max_results=20, workers=4):
+    """
+    runs several film searches concurrently, see scrape_many
 
-        except Exception as e:
-            print(f"Error searching for '{query}': {e}")
-        page.close()
-        browser.close()
+    Args:
+        queries: search query strings
+        max_results: maximum number of results per query
+        workers: number of searches run at the same time
 
-    return results
+    Returns:
+        list of result lists in queries order
+    """
+    results = scrape_many(search_films, [(query, max_results) for query in queries], workers)
+    return [films or [] for films in results]
 
 
-def search_films_advanced(query, filters=None, max_results=20):
+def search_films_advanced(query, filters=None, max_results=20, browser=None, standalone=False):
     """
     advanced film search with filters
 
@@ -80,6 +106,8 @@ def search_films_advanced(query, filters=None, max_results=20):
             - genre: e.g., "horror", "comedy"
             - year: specific year
         max_results: maximum results to return
+        browser: browser to use if the page needs one (defaults to this thread's pooled browser)
+        standalone: if True, launch a dedicated browser if the page needs one
 
     Returns:
         list of film results
@@ -97,52 +125,33 @@ def search_films_advanced(query, filters=None, max_results=20):
     search_url = base_url
     results = []
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+    with page_loader(browser, standalone) as load:
         try:
-            page.goto(search_url)
+            doc = load(search_url)
             print(f"Success: Advanced search at {search_url}")
 
-            posters = page.query_selector_all("li.poster-container")
-
-            for i, poster_container in enumerate(posters):
-                if i >= max_results:
-                    break
-
-                film_data = {
-                    "title": None,
-                    "film_slug": None,
-                    "poster_url": None,
-                }
-
-                poster = poster_container.query_selector("div.film-poster")
-                if poster:
-                    film_data["title"] = poster.get_attribute("data-film-name")
-                    film_data["film_slug"] = poster.get_attribute("data-film-slug")
-
-                img = poster_container.query_selector("img")
-                if img:
-                    film_data["poster_url"] = img.get_attribute("src")
-
-                if film_data["title"]:
-                    results.append(film_data)
+            items = doc.extract_all("li.poster-container", POSTER_RESULT_FIELDS)
+            results = [film for film in items[:max_results] if film["title"]]
 
         except Exception as e:
             print(f"Error in advanced search: {e}")
-        page.close()
-        browser.close()
 
     return results
 
 
-def get_popular_films(time_period="week", max_results=20):
+def get_popular_films(
+    time_period="week", max_results=20, browser=None, standalone=False, use_cache=True
+):
     """
     gets popular films on letterboxd
 
     Args:
         time_period: 'week', 'month', or 'year'
         max_results: maximum results to return
+        browser: browser to use if the page needs one (defaults to this thread's pooled browser)
+        standalone: if True, launch a dedicated browser if the page needs one
+        use_cache: if False, the page is fetched again instead of served from the
+            page cache
 
     Returns:
         list of popular films
@@ -157,42 +166,19 @@ def get_popular_films(time_period="week", max_results=20):
     url = f"https://letterboxd.com/films/popular/{period_path}"
     results = []
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+    with page_loader(browser, standalone) as load:
         try:
-            page.goto(url)
+            doc = load(url, cache_ttl=POPULAR_PAGE_CACHE_TTL if use_cache else 0)
             print(f"Success: Getting popular films for {time_period}")
 
-            posters = page.query_selector_all("li.poster-container")
-
-            for i, poster_container in enumerate(posters):
-                if i >= max_results:
-                    break
-
-                film_data = {
-                    "title": None,
-                    "film_slug": None,
-                    "poster_url": None,
-                    "rank": i + 1,
-                }
-
-                poster = poster_container.query_selector("div.film-poster")
-                if poster:
-                    film_data["title"] = poster.get_attribute("data-film-name")
-                    film_data["film_slug"] = poster.get_attribute("data-film-slug")
-
-                img = poster_container.query_selector("img")
-                if img:
-                    film_data["poster_url"] = img.get_attribute("src")
-
-                if film_data["title"]:
-                    results.append(film_data)
+            items = doc.extract_all("li.poster-container", POSTER_RESULT_FIELDS)
+            for rank, film in enumerate(items[:max_results], start=1):
+                if film["title"]:
+                    film["rank"] = rank
+                    results.append(film)
 
         except Exception as e:
             print(f"Error getting popular films: {e}")
-        page.close()
-        browser.close()
 
     return results
 
@@ -200,13 +186,15 @@ def get_popular_films(time_period="week", max_results=20):
 # ----- ACTIVITY FEED -----
 
 
-def scrape_activity_feed(target_url, max_items=50):
+def scrape_activity_feed(target_url, max_items=50, browser=None, standalone=False):
     """
     scrapes activity feed from user's followed accounts
 
     Args:
         target_url: letterboxd user profile URL
         max_items: maximum number of activity items to return
+        browser: browser to open the page in (defaults to this thread's pooled browser)
+        standalone: if True, launch a dedicated browser for this call
 
     Returns:
         list of activity items
@@ -214,67 +202,53 @@ def scrape_activity_feed(target_url, max_items=50):
     feed_url = f"{target_url}activity/"
     activities = []
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+    with scrape_page(browser, standalone) as page:
         try:
-            page.goto(feed_url)
+            page.goto(feed_url, wait_until=PAGE_LOAD_STATE)
             print(f"Success: Retrieved activity feed {feed_url}")
 
-            activity_items = page.query_selector_all("section.activity-row")
-
-            for i, item in enumerate(activity_items):
-                if i >= max_items:
-                    break
-
-                activity_data = {
-                    "type": None,
-                    "user": None,
-                    "film_name": None,
-                    "film_slug": None,
-                    "rating": None,
-                    "review_snippet": None,
-                }
-
-                user_link = item.query_selector("a.avatar")
-                if user_link:
-                    activity_data["user"] = user_link.get_attribute("href").strip("/")
-
-                poster = item.query_selector("div.film-poster")
-                if poster:
-                    activity_data["film_name"] = poster.get_attribute("data-film-name")
-                    activity_data["film_slug"] = poster.get_attribute("data-film-slug")
-
-                rating_el = item.query_selector("span.rating")
-                if rating_el:
-                    activity_data["rating"] = rating_el.inner_text().strip()
-                    activity_data["type"] = "rating"
-
-                review_el = item.query_selector("div.body-text")
-                if review_el:
-                    activity_data["review_snippet"] = review_el.inner_text().strip()[:200]
-                    activity_data["type"] = "review"
-
-                if not activity_data["type"]:
-                    activity_data["type"] = "activity"
-
-                activities.append(activity_data)
+            # activity rows are filled in by script after the document is parsed
+            safe_wait_for_selector(page, "section.activity-row", timeout=ACTIVITY_WAIT_TIMEOUT)
+
+            rows = extract_items(page, "section.activity-row", ACTIVITY_FIELDS)
+            for row in rows[:max_items]:
+                review = row["review"]
+                if review is not None:
+                    activity_type = "review"
+                elif row["rating"] is not None:
+                    activity_type = "rating"
+                else:
+                    activity_type = "activity"
+                activities.append(
+                    {
+                        "type": activity_type,
+                        "user": row["user"].strip("/") if row["user"] else None,
+                        "film_name": row["film_name"],
+                        "film_slug": row["film_slug"],
+                        "rating": row["rating"],
+                        "review_snippet": review[:200] if review is not None else None,
+                    }
+                )
 
         except Exception as e:
             print(f"Error getting activity feed: {e}")
-        page.close()
-        browser.close()
 
     return activities
 
 
-def scrape_popular_reviews(film_slug, max_reviews=20):
+def scrape_popular_reviews(
+    film_slug, max_reviews=20, browser=None, standalone=False, use_cache=True
+):
     """
     scrapes popular reviews for a film
 
     Args:
         film_slug: letterboxd film slug
         max_reviews: maximum number of reviews to return
+        browser: browser to use if the page needs one (defaults to this thread's pooled browser)
+        standalone: if True, launch a dedicated browser if the page needs one
+        use_cache: if False, the page is fetched again instead of served from the
+            page cache
 
     Returns:
         list of popular reviews
@@ -282,48 +256,24 @@ def scrape_popular_reviews(film_slug, max_reviews=20):
     reviews_url = f"https://letterboxd.com/film/{film_slug}/reviews/by/activity/"
     reviews = []
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+    with page_loader(browser, standalone) as load:
         try:
-            page.goto(reviews_url)
+            doc = load(reviews_url, cache_ttl=POPULAR_PAGE_CACHE_TTL if use_cache else 0)
             print(f"Success: Getting popular reviews for {film_slug}")
 
-            review_items = page.query_selector_all("li.film-detail")
-
-            for i, item in enumerate(review_items):
-                if i >= max_reviews:
-                    break
-
-                review_data = {
-                    "user": None,
-                    "rating": None,
-                    "review_text": None,
-                    "likes_count": None,
-                    "date": None,
-                }
-
-                user_link = item.query_selector("a.avatar")
-                if user_link:
-                    review_data["user"] = user_link.get_attribute("href").strip("/")
-
-                rating_el = item.query_selector("span.rating")
-                if rating_el:
-                    review_data["rating"] = rating_el.inner_text().strip()
-
-                review_body = item.query_selector("div.body-text")
-                if review_body:
-                    review_data["review_text"] = review_body.inner_text().strip()
-
-                date_el = item.query_selector("span.date a")
-                if date_el:
-                    review_data["date"] = date_el.inner_text().strip()
-
-                reviews.append(review_data)
+            items = doc.extract_all("li.film-detail", POPULAR_REVIEW_FIELDS)
+            for item in items[:max_reviews]:
+                reviews.append(
+                    {
+                        "user": item["user"].strip("/") if item["user"] else None,
+                        "rating": item["rating"],
+                        "review_text": item["review_text"],
+                        "likes_count": None,
+                        "date": item["date"],
+                    }
+                )
 
         except Exception as e:
             print(f"Error getting popular reviews: {e}")
-        page.close()
-        browser.close()
 
     return reviews
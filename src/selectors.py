@@ -2,6 +2,12 @@
 
 import json
 
+# optional speedup: pip install orjson
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 DEFAULT_SELECTORS = {
     "profile": {
         "content_wrap": "div#content div.content-wrap",
@@ -67,7 +73,13 @@ DEFAULT_SELECTORS = {
     },
 }
 
-_selectors = DEFAULT_SELECTORS.copy()
+
+def _copy_defaults():
+    """copies DEFAULT_SELECTORS one category deep, so edits never reach the defaults"""
+    return {category: dict(selectors) for category, selectors in DEFAULT_SELECTORS.items()}
+
+
+_selectors = _copy_defaults()
 
 
 def load_selectors_from_file(filepath):
@@ -81,8 +93,12 @@ def load_selectors_from_file(filepath):
         loaded selectors dict
     """
     global _selectors
-    with open(filepath, "r", encoding="utf-8") as f:
-        custom_selectors = json.load(f)
+    if orjson is not None:
+        with open(filepath, "rb") as f:
+            custom_selectors = orjson.loads(f.read())
+    else:
+        with open(filepath, "r", encoding="utf-8") as f:
+            custom_selectors = json.load(f)
 
     # deep merge with defaults
     for category, selectors in custom_selectors.items():
@@ -101,8 +117,12 @@ def save_selectors_to_file(filepath):
     Args:
         filepath: path to save config file
     """
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(_selectors, f, indent=2)
+    if orjson is not None:
+        with open(filepath, "wb") as f:
+            f.write(orjson.dumps(_selectors, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(_selectors, f, indent=2)
     print(f"Saved selectors to {filepath}")
 
 
@@ -117,7 +137,8 @@ def get_selector(category, name):
     Returns:
         CSS selector string or None
     """
-    return _selectors.get(category, {}).get(name)
+    selectors = _selectors.get(category)
+    return selectors.get(name) if selectors is not None else None
 
 
 def set_selector(category, name, selector):
@@ -136,5 +157,6 @@ def set_selector(category, name, selector):
 
 def reset_selectors():
     """resets selectors to defaults"""
-    global _selectors
-    _selectors = DEFAULT_SELECTORS.copy()
+    # reset in place so modules that imported _selectors see the defaults too
+    _selectors.clear()
+    _selectors.update(_copy_defaults())
@@ -1,13 +1,27 @@
 # ----- BATCH OPERATIONS & SNAPSHOTS -----
 
+import re
 import time
 import json
+import itertools
+from collections import Counter
 from pathlib import Path
 
+# optional speedup: pip install orjson
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .progress import ProgressTracker
 
+# the number a statistic starts with, e.g. "1,234" in "1,234 films"
+LEADING_COUNT_PATTERN = re.compile(r"\s*([\d,]*\d)")
+
 
-def batch_scrape_users(usernames, base_url="https://letterboxd.com", progress_callback=None):
+def batch_scrape_users(
+    usernames, base_url="https://letterboxd.com", progress_callback=None, workers=4
+):
     """
     scrapes multiple user profiles
 
@@ -15,28 +29,36 @@ def batch_scrape_users(usernames, base_url="https://letterboxd.com", progress_ca
         usernames: list of usernames to scrape
         base_url: base letterboxd URL
         progress_callback: optional progress callback
+        workers: number of profiles scraped at the same time
 
     Returns:
         dict with results for each user
     """
+    from .browser import scrape_many
     from .scrapers import scrape_letterboxd
 
     tracker = ProgressTracker(len(usernames), progress_callback)
     tracker.start()
     results = {}
 
-    for username in usernames:
-        try:
-            target_url = f"{base_url}/{username}/"
-            result = scrape_letterboxd(target_url, paginate=True)
+    def record(index, result, error):
+        username = usernames[index]
+        if error is None:
             results[username] = {"success": True, "data": result}
             tracker.update(message=f"Scraped {username}")
-        except Exception as e:
-            results[username] = {"success": False, "error": str(e)}
-            tracker.error(f"Failed to scrape {username}: {e}")
+        else:
+            results[username] = {"success": False, "error": str(error)}
+            tracker.error(f"Failed to scrape {username}: {error}")
+
+    scrape_many(
+        scrape_letterboxd,
+        [(f"{base_url}/{username}/", True) for username in usernames],
+        workers=workers,
+        on_complete=record,
+    )
 
     tracker.complete()
-    return results
+    return {username: results[username] for username in usernames}
 
 
 def aggregate_batch_results(batch_results):
@@ -69,11 +91,9 @@ def aggregate_batch_results(batch_results):
             stats_raw = profile.get("user_statistics", [])
             for stat in stats_raw:
                 if "films" in stat.lower():
-                    try:
-                        count = int("".join(filter(str.isdigit, stat.split()[0])))
-                        stats["total_films_watched"] += count
-                    except (ValueError, IndexError):
-                        pass
+                    match = LEADING_COUNT_PATTERN.match(stat)
+                    if match:
+                        stats["total_films_watched"] += int(match.group(1).replace(",", ""))
 
             # count watchlist
             watchlist = scraped.get("films", {}).get("watchlist", [])
@@ -92,6 +112,13 @@ def aggregate_batch_results(batch_results):
     return stats
 
 
+def _list_item_key(item):
+    """identity of a list entry: films by slug, anything else by its text"""
+    if isinstance(item, dict) and item.get("film_slug"):
+        return item["film_slug"]
+    return str(item)
+
+
 def compute_delta(old_data, new_data, path=""):
     """
     computes differences between two data snapshots
@@ -106,50 +133,63 @@ def compute_delta(old_data, new_data, path=""):
     """
     delta = {"added": [], "removed": [], "changed": []}
 
-    if isinstance(old_data, dict) and isinstance(new_data, dict):
-        old_keys = set(old_data.keys())
-        new_keys = set(new_data.keys())
-
-        # added keys
-        for key in new_keys - old_keys:
-            delta["added"].append({"path": f"{path}.{key}" if path else key, "value": new_data[key]})
-
-        # removed keys
-        for key in old_keys - new_keys:
-            delta["removed"].append({"path": f"{path}.{key}" if path else key, "value": old_data[key]})
-
-        # changed keys
-        for key in old_keys & new_keys:
-            new_path = f"{path}.{key}" if path else key
-            if old_data[key] != new_data[key]:
-                if isinstance(old_data[key], (dict, list)) and isinstance(new_data[key], (dict, list)):
-                    sub_delta = compute_delta(old_data[key], new_data[key], new_path)
-                    delta["added"].extend(sub_delta["added"])
-                    delta["removed"].extend(sub_delta["removed"])
-                    delta["changed"].extend(sub_delta["changed"])
+    # nested containers are walked with an explicit stack instead of recursive calls,
+    # so every level appends straight into delta instead of merging sub-deltas
+    stack = [(old_data, new_data, path)]
+    while stack:
+        old, new, path = stack.pop()
+
+        if isinstance(old, dict) and isinstance(new, dict):
+            # added keys
+            for key in new.keys() - old.keys():
+                delta["added"].append({"path": f"{path}.{key}" if path else key, "value": new[key]})
+
+            # removed keys
+            for key in old.keys() - new.keys():
+                delta["removed"].append(
+                    {"path": f"{path}.{key}" if path else key, "value": old[key]}
+                )
+
+            # changed keys
+            for key in old.keys() & new.keys():
+                old_value = old[key]
+                new_value = new[key]
+                if old_value == new_value:
+                    continue
+                new_path = f"{path}.{key}" if path else key
+                if isinstance(old_value, (dict, list)) and isinstance(new_value, (dict, list)):
+                    stack.append((old_value, new_value, new_path))
                 else:
                     delta["changed"].append(
-                        {
-                            "path": new_path,
-                            "old_value": old_data[key],
-                            "new_value": new_data[key],
-                        }
+                        {"path": new_path, "old_value": old_value, "new_value": new_value}
                     )
 
-    elif isinstance(old_data, list) and isinstance(new_data, list):
-        old_set = set(str(x) for x in old_data)
-        new_set = set(str(x) for x in new_data)
-
-        for item in new_set - old_set:
-            delta["added"].append({"path": path, "value": item})
-        for item in old_set - new_set:
-            delta["removed"].append({"path": path, "value": item})
-
-    else:
-        if old_data != new_data:
-            delta["changed"].append(
-                {"path": path, "old_value": old_data, "new_value": new_data}
-            )
+        elif isinstance(old, list) and isinstance(new, list):
+            old_items = {_list_item_key(x): x for x in old}
+            new_items = {_list_item_key(x): x for x in new}
+
+            if len(old_items) < len(old) or len(new_items) < len(new):
+                # a key repeats (e.g. a rewatched film in a diary), so entries are
+                # matched as whole items, counting how often each one appears
+                old_counts = Counter(str(x) for x in old)
+                new_counts = Counter(str(x) for x in new)
+                for item, count in (new_counts - old_counts).items():
+                    delta["added"].extend({"path": path, "value": item} for _ in range(count))
+                for item, count in (old_counts - new_counts).items():
+                    delta["removed"].extend({"path": path, "value": item} for _ in range(count))
+                continue
+
+            for key in new_items.keys() - old_items.keys():
+                delta["added"].append({"path": path, "value": str(new_items[key])})
+            for key in old_items.keys() - new_items.keys():
+                delta["removed"].append({"path": path, "value": str(old_items[key])})
+            # the same entry with edited fields, e.g. a new rating for a film
+            for key in old_items.keys() & new_items.keys():
+                if old_items[key] != new_items[key]:
+                    stack.append((old_items[key], new_items[key], f"{path}[{key}]"))
+
+        elif old != new:
+            delta["changed"].append({"path": path, "old_value": old, "new_value": new})
 
     return delta
 
@@ -174,19 +214,17 @@ def detect_profile_changes(old_profile, new_profile):
     }
 
     # categorize changes
-    summary["watchlist_changes"] = [
-        c
-        for c in delta["added"] + delta["removed"]
-        if "watchlist" in c.get("path", "")
-    ]
-    summary["favourite_changes"] = [
-        c
-        for c in delta["added"] + delta["removed"]
-        if "favourite" in c.get("path", "")
-    ]
-    summary["profile_changes"] = [
-        c for c in delta["changed"] if "profile" in c.get("path", "")
-    ]
+    watchlist_changes = []
+    favourite_changes = []
+    for c in itertools.chain(delta["added"], delta["removed"], delta["changed"]):
+        change_path = c.get("path", "")
+        if "watchlist" in change_path:
+            watchlist_changes.append(c)
+        if "favourite" in change_path:
+            favourite_changes.append(c)
+    summary["watchlist_changes"] = watchlist_changes
+    summary["favourite_changes"] = favourite_changes
+    summary["profile_changes"] = [c for c in delta["changed"] if "profile" in c.get("path", "")]
 
     return summary
 
@@ -212,8 +250,12 @@ def save_snapshot(data, username, snapshot_dir=None):
     filename = f"{username}_{timestamp}.json"
     filepath = snapshot_dir / filename
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        filepath.write_bytes(orjson.dumps(data, option=option))
+    else:
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
 
     return str(filepath)
 
@@ -236,12 +278,15 @@ def load_latest_snapshot(username, snapshot_dir=None):
     if not snapshot_dir.exists():
         return None, None
 
-    snapshots = sorted(snapshot_dir.glob(f"{username}_*.json"), reverse=True)
-    if not snapshots:
+    # timestamped names order chronologically, so the newest is the largest name
+    latest = max(snapshot_dir.glob(f"{username}_*.json"), key=lambda p: p.name, default=None)
+    if latest is None:
         return None, None
 
-    latest = snapshots[0]
-    with open(latest, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    if orjson is not None:
+        data = orjson.loads(latest.read_bytes())
+    else:
+        with open(latest, "r", encoding="utf-8") as f:
+            data = json.load(f)
 
     return data, str(latest)
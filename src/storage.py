@@ -1,6 +1,106 @@
 # ----- STORAGE BACKENDS -----
 
 import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# optional speedup: pip install orjson
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# ----- SQL STATEMENTS -----
+
+SQLITE_INSERT_USER = """
+    INSERT OR REPLACE INTO users (username, display_name, bio, profile_image)
+    VALUES (?, ?, ?, ?)
+"""
+SQLITE_INSERT_FILM = """
+    INSERT OR REPLACE INTO films (slug, title, year, director, runtime, genres, average_rating)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+SQLITE_INSERT_SCRAPE_RESULT = """
+    INSERT INTO scrape_history (url, data_type, data)
+    VALUES (?, ?, ?)
+"""
+
+# postgres statements take every row through psycopg2.extras.execute_values, which
+# expands VALUES %s into one multi-row VALUES list per page of rows
+BULK_PAGE_SIZE = 1000
+
+# bulk SQLite saves put up to this many rows into one multi-row VALUES statement, fewer
+# when the connection's bound-variable limit is lower
+SQLITE_ROWS_PER_STATEMENT = 500
+SQLITE_DEFAULT_MAX_VARIABLES = 999
+
+POSTGRES_INSERT_USER = """
+    INSERT INTO users (username, display_name, bio, profile_image)
+    VALUES %s
+    ON CONFLICT (username) DO UPDATE SET
+        display_name = EXCLUDED.display_name,
+        bio = EXCLUDED.bio,
+        profile_image = EXCLUDED.profile_image,
+        scraped_at = CURRENT_TIMESTAMP"""
+POSTGRES_INSERT_FILM = """
+    INSERT INTO films (slug, title, year, director, runtime, genres, average_rating)
+    VALUES %s
+    ON CONFLICT (slug) DO UPDATE SET
+        title = EXCLUDED.title,
+        year = EXCLUDED.year,
+        director = EXCLUDED.director,
+        runtime = EXCLUDED.runtime,
+        genres = EXCLUDED.genres,
+        average_rating = EXCLUDED.average_rating,
+        scraped_at = CURRENT_TIMESTAMP"""
+POSTGRES_INSERT_SCRAPE_RESULT = """
+    INSERT INTO scrape_history (url, data_type, data)
+    VALUES %s"""
+
+
+def _dumps(data):
+    """encodes a JSON column value as text, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data)
+
+
+def _loads(payload):
+    """decodes a JSON column value written by _dumps"""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _user_row(user_data):
+    """column values for the users table, in INSERT order"""
+    profile = user_data.get("scraped_data", {}).get("profile", {})
+    return (
+        profile.get("user_data_person"),
+        profile.get("user_name"),
+        profile.get("user_bio"),
+        profile.get("user_profile_image"),
+    )
+
+
+def _film_row(film_data):
+    """column values for the films table, in INSERT order"""
+    return (
+        film_data.get("film_slug"),
+        film_data.get("title"),
+        film_data.get("year"),
+        film_data.get("director"),
+        film_data.get("runtime"),
+        _dumps(film_data.get("genres", [])),
+        film_data.get("average_rating"),
+    )
+
+
+def _scrape_result_row(url, data_type, data):
+    """column values for the scrape_history table, in INSERT order"""
+    return (url, data_type, _dumps(data))
 
 
 class SQLiteStorage:
@@ -15,13 +115,27 @@ class SQLiteStorage:
         """
         self.db_path = db_path
         self.conn = None
+        self._max_variables = SQLITE_DEFAULT_MAX_VARIABLES
+        # the connection is shared between threads, every use of it is serialized so
+        # no thread reads or writes inside another thread's open transaction();
+        # reentrant so saves and reads can run inside one
+        self._write_lock = threading.RLock()
 
     def connect(self):
         """establishes database connection"""
-        import sqlite3
-
-        self.conn = sqlite3.connect(self.db_path)
+        # autocommit mode, transactions are opened explicitly by transaction()
+        self.conn = sqlite3.connect(
+            self.db_path, timeout=30, check_same_thread=False, isolation_level=None
+        )
         self.conn.row_factory = sqlite3.Row
+        if self.db_path != ":memory:":
+            # readers no longer block the writer, and commits fsync far less often
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA cache_size=-65536")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        if hasattr(self.conn, "getlimit"):
+            self._max_variables = self.conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
         self._create_tables()
         return self
 
@@ -80,89 +194,160 @@ class SQLiteStorage:
                 scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             );
 
-            CREATE INDEX IF NOT EXISTS idx_users_username ON users(username);
-            CREATE INDEX IF NOT EXISTS idx_films_slug ON films(slug);
             CREATE INDEX IF NOT EXISTS idx_user_films_user ON user_films(user_id);
+
+            -- username and slug are UNIQUE, which already indexes them
+            DROP INDEX IF EXISTS idx_users_username;
+            DROP INDEX IF EXISTS idx_films_slug;
         """
         )
         self.conn.commit()
 
+    def _insert_rows(self, sql, rows):
+        """
+        inserts rows with sql, a single-row INSERT ending in VALUES (?, ...), by
+        repeating its VALUES group so each statement carries many rows
+
+        must be called inside transaction()
+        """
+        if not rows:
+            return
+        head, group = sql.rsplit("VALUES", 1)
+        group = group.strip()
+        width = len(rows[0])
+        per_statement = max(1, min(SQLITE_ROWS_PER_STATEMENT, self._max_variables // width))
+        for start in range(0, len(rows), per_statement):
+            chunk = rows[start : start + per_statement]
+            values = ", ".join([group] * len(chunk))
+            params = [value for row in chunk for value in row]
+            self.conn.execute(f"{head}VALUES {values}", params)
+
+    @contextmanager
+    def transaction(self):
+        """
+        groups saves into one transaction, committed once at the end (rolled back
+        on error), so many saves cost a single commit
+
+        Other threads' writes wait until it ends. Nested use joins the outer
+        transaction.
+        """
+        with self._write_lock:
+            if self.conn.in_transaction:
+                yield self
+                return
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
     def save_user(self, user_data):
         """saves user profile data"""
-        cursor = self.conn.cursor()
-        profile = user_data.get("scraped_data", {}).get("profile", {})
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO users (username, display_name, bio, profile_image)
-            VALUES (?, ?, ?, ?)
-        """,
-            (
-                profile.get("user_data_person"),
-                profile.get("user_name"),
-                profile.get("user_bio"),
-                profile.get("user_profile_image"),
-            ),
-        )
-        self.conn.commit()
-        return cursor.lastrowid
+        with self.transaction():
+            cursor = self.conn.cursor()
+            cursor.execute(SQLITE_INSERT_USER, _user_row(user_data))
+            return cursor.lastrowid
+
+    def save_users(self, users):
+        """saves many user profiles in one transaction, returns the number saved"""
+        rows = [_user_row(user_data) for user_data in users]
+        with self.transaction():
+            self._insert_rows(SQLITE_INSERT_USER, rows)
+        return len(rows)
 
     def save_film(self, film_data):
         """saves film details"""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO films (slug, title, year, director, runtime, genres, average_rating)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                film_data.get("film_slug"),
-                film_data.get("title"),
-                film_data.get("year"),
-                film_data.get("director"),
-                film_data.get("runtime"),
-                json.dumps(film_data.get("genres", [])),
-                film_data.get("average_rating"),
-            ),
-        )
-        self.conn.commit()
-        return cursor.lastrowid
+        with self.transaction():
+            cursor = self.conn.cursor()
+            cursor.execute(SQLITE_INSERT_FILM, _film_row(film_data))
+            return cursor.lastrowid
+
+    def save_films(self, films):
+        """saves many films in one transaction, returns the number saved"""
+        rows = [_film_row(film_data) for film_data in films]
+        with self.transaction():
+            self._insert_rows(SQLITE_INSERT_FILM, rows)
+        return len(rows)
 
     def save_scrape_result(self, url, data_type, data):
         """saves raw scrape result for history"""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO scrape_history (url, data_type, data)
-            VALUES (?, ?, ?)
-        """,
-            (url, data_type, json.dumps(data)),
-        )
-        self.conn.commit()
-        return cursor.lastrowid
+        with self.transaction():
+            cursor = self.conn.cursor()
+            cursor.execute(SQLITE_INSERT_SCRAPE_RESULT, _scrape_result_row(url, data_type, data))
+            return cursor.lastrowid
+
+    def save_scrape_results(self, results):
+        """
+        saves many raw scrape results in one transaction
+
+        Args:
+            results: iterable of (url, data_type, data) tuples
+
+        Returns:
+            number of results saved
+        """
+        rows = [_scrape_result_row(*result) for result in results]
+        with self.transaction():
+            self._insert_rows(SQLITE_INSERT_SCRAPE_RESULT, rows)
+        return len(rows)
 
     def get_user(self, username):
         """retrieves user by username"""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM users WHERE username = ?", (username,))
-        row = cursor.fetchone()
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT * FROM users WHERE username = ?", (username,))
+            row = cursor.fetchone()
         return dict(row) if row else None
 
     def get_film(self, slug):
         """retrieves film by slug"""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM films WHERE slug = ?", (slug,))
-        row = cursor.fetchone()
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT * FROM films WHERE slug = ?", (slug,))
+            row = cursor.fetchone()
         if row:
             result = dict(row)
-            result["genres"] = json.loads(result.get("genres", "[]"))
+            result["genres"] = _loads(result.get("genres", "[]"))
             return result
         return None
 
+    @contextmanager
+    def bulk_load(self):
+        """
+        speeds up a large one-off import: commits are not synced to disk and the
+        user_films index is rebuilt once at the end instead of on every insert
+
+        A crash or power loss inside the block can lose or corrupt what it wrote,
+        so only use it for data that can be scraped again. The journal mode is
+        left alone, switching away from WAL needs every other connection closed.
+
+        bulk_load wraps transactions, it cannot run inside one: SQLite refuses to
+        change the sync level mid-transaction, so opening it inside transaction()
+        raises RuntimeError. Other threads wait until the block ends.
+        """
+        with self._write_lock:
+            if self.conn.in_transaction:
+                raise RuntimeError("bulk_load() cannot be used inside a transaction")
+            self.conn.execute("PRAGMA synchronous=OFF")
+            self.conn.execute("DROP INDEX IF EXISTS idx_user_films_user")
+            try:
+                yield self
+            finally:
+                self.conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_user_films_user ON user_films(user_id)"
+                )
+                synchronous = "NORMAL" if self.db_path != ":memory:" else "FULL"
+                self.conn.execute(f"PRAGMA synchronous={synchronous}")
+
     def query(self, sql, params=()):
         """executes custom SQL query"""
-        cursor = self.conn.cursor()
-        cursor.execute(sql, params)
-        return [dict(row) for row in cursor.fetchall()]
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+        return [dict(row) for row in rows]
 
     def close(self):
         """closes database connection"""
@@ -184,7 +369,14 @@ class PostgreSQLStorage:
     """
 
     def __init__(
-        self, host="localhost", port=5432, database="bumi", user="postgres", password=""
+        self,
+        host="localhost",
+        port=5432,
+        database="bumi",
+        user="postgres",
+        password="",
+        minconn=1,
+        maxconn=16,
     ):
         """
         Args:
@@ -193,6 +385,8 @@ class PostgreSQLStorage:
             database: database name
             user: database user
             password: database password
+            minconn: connections the pool keeps open
+            maxconn: most connections open at once, one per concurrently working thread
         """
         self.config = {
             "host": host,
@@ -201,180 +395,185 @@ class PostgreSQLStorage:
             "user": user,
             "password": password,
         }
-        self.conn = None
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self._pool = None
+        self._extras = None
 
     def connect(self):
         """establishes database connection"""
         try:
             import psycopg2
             import psycopg2.extras
+            import psycopg2.pool
         except ImportError:
             raise ImportError("psycopg2 required: pip install psycopg2-binary")
 
-        self.conn = psycopg2.connect(**self.config)
+        self._extras = psycopg2.extras
+        self._pool = psycopg2.pool.ThreadedConnectionPool(self.minconn, self.maxconn, **self.config)
         self._create_tables()
         return self
 
+    @contextmanager
+    def _cursor(self):
+        """borrows a pooled connection for one unit of work, committed if it succeeds"""
+        conn = self._pool.getconn()
+        try:
+            with conn.cursor() as cursor:
+                yield cursor
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._pool.putconn(conn)
+
     def _create_tables(self):
         """creates required database tables"""
-        cursor = self.conn.cursor()
-        cursor.execute(
+        with self._cursor() as cursor:
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS users (
+                    id SERIAL PRIMARY KEY,
+                    username VARCHAR(255) UNIQUE NOT NULL,
+                    display_name VARCHAR(255),
+                    bio TEXT,
+                    profile_image TEXT,
+                    scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+
+                CREATE TABLE IF NOT EXISTS films (
+                    id SERIAL PRIMARY KEY,
+                    slug VARCHAR(255) UNIQUE NOT NULL,
+                    title VARCHAR(500),
+                    year VARCHAR(10),
+                    director VARCHAR(255),
+                    runtime VARCHAR(50),
+                    genres JSONB DEFAULT '[]',
+                    average_rating VARCHAR(20),
+                    scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+
+                CREATE TABLE IF NOT EXISTS user_films (
+                    id SERIAL PRIMARY KEY,
+                    user_id INTEGER REFERENCES users(id),
+                    film_slug VARCHAR(255),
+                    rating VARCHAR(20),
+                    watched_date VARCHAR(50),
+                    rewatch BOOLEAN DEFAULT FALSE,
+                    liked BOOLEAN DEFAULT FALSE,
+                    review TEXT
+                );
+
+                CREATE TABLE IF NOT EXISTS watchlist (
+                    id SERIAL PRIMARY KEY,
+                    user_id INTEGER REFERENCES users(id),
+                    film_slug VARCHAR(255),
+                    film_name VARCHAR(500),
+                    added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+
+                CREATE TABLE IF NOT EXISTS scrape_history (
+                    id SERIAL PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    data_type VARCHAR(100),
+                    data JSONB,
+                    scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+
+                CREATE INDEX IF NOT EXISTS idx_pg_user_films_user ON user_films(user_id);
+
+                -- username and slug are UNIQUE, which already indexes them
+                DROP INDEX IF EXISTS idx_pg_users_username;
+                DROP INDEX IF EXISTS idx_pg_films_slug;
             """
-            CREATE TABLE IF NOT EXISTS users (
-                id SERIAL PRIMARY KEY,
-                username VARCHAR(255) UNIQUE NOT NULL,
-                display_name VARCHAR(255),
-                bio TEXT,
-                profile_image TEXT,
-                scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-
-            CREATE TABLE IF NOT EXISTS films (
-                id SERIAL PRIMARY KEY,
-                slug VARCHAR(255) UNIQUE NOT NULL,
-                title VARCHAR(500),
-                year VARCHAR(10),
-                director VARCHAR(255),
-                runtime VARCHAR(50),
-                genres JSONB DEFAULT '[]',
-                average_rating VARCHAR(20),
-                scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-
-            CREATE TABLE IF NOT EXISTS user_films (
-                id SERIAL PRIMARY KEY,
-                user_id INTEGER REFERENCES users(id),
-                film_slug VARCHAR(255),
-                rating VARCHAR(20),
-                watched_date VARCHAR(50),
-                rewatch BOOLEAN DEFAULT FALSE,
-                liked BOOLEAN DEFAULT FALSE,
-                review TEXT
-            );
-
-            CREATE TABLE IF NOT EXISTS watchlist (
-                id SERIAL PRIMARY KEY,
-                user_id INTEGER REFERENCES users(id),
-                film_slug VARCHAR(255),
-                film_name VARCHAR(500),
-                added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-
-            CREATE TABLE IF NOT EXISTS scrape_history (
-                id SERIAL PRIMARY KEY,
-                url TEXT NOT NULL,
-                data_type VARCHAR(100),
-                data JSONB,
-                scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
+            )
 
-            CREATE INDEX IF NOT EXISTS idx_pg_users_username ON users(username);
-            CREATE INDEX IF NOT EXISTS idx_pg_films_slug ON films(slug);
-            CREATE INDEX IF NOT EXISTS idx_pg_user_films_user ON user_films(user_id);
-        """
-        )
-        self.conn.commit()
+    def _execute_values(self, sql, rows, fetch=False):
+        """runs sql once for all rows via execute_values and commits"""
+        with self._cursor() as cursor:
+            return self._extras.execute_values(
+                cursor, sql, rows, page_size=BULK_PAGE_SIZE, fetch=fetch
+            )
 
     def save_user(self, user_data):
         """saves user profile data"""
-        cursor = self.conn.cursor()
-        profile = user_data.get("scraped_data", {}).get("profile", {})
-        cursor.execute(
-            """
-            INSERT INTO users (username, display_name, bio, profile_image)
-            VALUES (%s, %s, %s, %s)
-            ON CONFLICT (username) DO UPDATE SET
-                display_name = EXCLUDED.display_name,
-                bio = EXCLUDED.bio,
-                profile_image = EXCLUDED.profile_image,
-                scraped_at = CURRENT_TIMESTAMP
-            RETURNING id
-        """,
-            (
-                profile.get("user_data_person"),
-                profile.get("user_name"),
-                profile.get("user_bio"),
-                profile.get("user_profile_image"),
-            ),
-        )
-        self.conn.commit()
-        return cursor.fetchone()[0]
+        sql = POSTGRES_INSERT_USER + " RETURNING id"
+        rows = self._execute_values(sql, [_user_row(user_data)], fetch=True)
+        return rows[0][0]
+
+    def save_users(self, users):
+        """saves many user profiles in one transaction, returns the number saved"""
+        # one statement can't upsert the same username twice, the last copy wins
+        rows = list({row[0]: row for row in map(_user_row, users)}.values())
+        self._execute_values(POSTGRES_INSERT_USER, rows)
+        return len(rows)
 
     def save_film(self, film_data):
         """saves film details"""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO films (slug, title, year, director, runtime, genres, average_rating)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (slug) DO UPDATE SET
-                title = EXCLUDED.title,
-                year = EXCLUDED.year,
-                director = EXCLUDED.director,
-                runtime = EXCLUDED.runtime,
-                genres = EXCLUDED.genres,
-                average_rating = EXCLUDED.average_rating,
-                scraped_at = CURRENT_TIMESTAMP
-            RETURNING id
-        """,
-            (
-                film_data.get("film_slug"),
-                film_data.get("title"),
-                film_data.get("year"),
-                film_data.get("director"),
-                film_data.get("runtime"),
-                json.dumps(film_data.get("genres", [])),
-                film_data.get("average_rating"),
-            ),
-        )
-        self.conn.commit()
-        return cursor.fetchone()[0]
+        sql = POSTGRES_INSERT_FILM + " RETURNING id"
+        rows = self._execute_values(sql, [_film_row(film_data)], fetch=True)
+        return rows[0][0]
+
+    def save_films(self, films):
+        """saves many films in one transaction, returns the number saved"""
+        # one statement can't upsert the same slug twice, the last copy wins
+        rows = list({row[0]: row for row in map(_film_row, films)}.values())
+        self._execute_values(POSTGRES_INSERT_FILM, rows)
+        return len(rows)
 
     def save_scrape_result(self, url, data_type, data):
         """saves raw scrape result for history"""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO scrape_history (url, data_type, data)
-            VALUES (%s, %s, %s)
-            RETURNING id
-        """,
-            (url, data_type, json.dumps(data)),
-        )
-        self.conn.commit()
-        return cursor.fetchone()[0]
+        sql = POSTGRES_INSERT_SCRAPE_RESULT + " RETURNING id"
+        rows = self._execute_values(sql, [_scrape_result_row(url, data_type, data)], fetch=True)
+        return rows[0][0]
+
+    def save_scrape_results(self, results):
+        """
+        saves many raw scrape results in one transaction
+
+        Args:
+            results: iterable of (url, data_type, data) tuples
+
+        Returns:
+            number of results saved
+        """
+        rows = [_scrape_result_row(*result) for result in results]
+        self._execute_values(POSTGRES_INSERT_SCRAPE_RESULT, rows)
+        return len(rows)
 
     def get_user(self, username):
         """retrieves user by username"""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM users WHERE username = %s", (username,))
-        row = cursor.fetchone()
-        if row:
-            columns = [desc[0] for desc in cursor.description]
-            return dict(zip(columns, row))
+        with self._cursor() as cursor:
+            cursor.execute("SELECT * FROM users WHERE username = %s", (username,))
+            row = cursor.fetchone()
+            if row:
+                columns = [desc[0] for desc in cursor.description]
+                return dict(zip(columns, row))
         return None
 
     def get_film(self, slug):
         """retrieves film by slug"""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM films WHERE slug = %s", (slug,))
-        row = cursor.fetchone()
-        if row:
-            columns = [desc[0] for desc in cursor.description]
-            return dict(zip(columns, row))
+        with self._cursor() as cursor:
+            cursor.execute("SELECT * FROM films WHERE slug = %s", (slug,))
+            row = cursor.fetchone()
+            if row:
+                columns = [desc[0] for desc in cursor.description]
+                return dict(zip(columns, row))
         return None
 
     def query(self, sql, params=()):
         """executes custom SQL query"""
-        cursor = self.conn.cursor()
-        cursor.execute(sql, params)
-        columns = [desc[0] for desc in cursor.description]
-        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        with self._cursor() as cursor:
+            cursor.execute(sql, params)
+            columns = [desc[0] for desc in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
 
     def close(self):
-        """closes database connection"""
-        if self.conn:
-            self.conn.close()
+        """closes every pooled database connection"""
+        if self._pool:
+            self._pool.closeall()
+            self._pool = None
 
     def __enter__(self):
         return self.connect()
@@ -1,10 +1,15 @@
 # ----- INPUT VALIDATION -----
 
 import re
+import time
+import functools
 import urllib.parse
-from playwright.sync_api import sync_playwright
 
 from .exceptions import InvalidURLError
+from .cache import cache_get, cache_set
+from .browser import scrape_page, host_slot
+from .config import PAGE_LOAD_STATE
+from .fetcher import http_fetch_available, get_http_client, HTMLParser
 
 LETTERBOXD_DOMAIN = "letterboxd.com"
 LETTERBOXD_URL_PATTERN = re.compile(
@@ -12,7 +17,32 @@ LETTERBOXD_URL_PATTERN = re.compile(
 )
 LETTERBOXD_USERNAME_PATTERN = re.compile(r"^[a-zA-Z0-9_]+$")
 
+# profile existence answers are reused for this long (seconds)
+PROFILE_CHECK_TTL = 3600
+# older answers are still served when letterboxd is rate limiting or unreachable
+PROFILE_CHECK_STALE_TTL = 24 * 3600
 
+PROFILE_HEADER_SELECTOR = "section.profile-header"
+
+# how many distinct inputs each validator remembers
+VALIDATION_CACHE_SIZE = 4096
+
+
+def _cached_result(func):
+    """memoizes a validator on its argument, handing out a fresh result dict every call"""
+    cached = functools.lru_cache(maxsize=VALIDATION_CACHE_SIZE)(
+        lambda value: tuple(func(value).items())
+    )
+
+    @functools.wraps(func)
+    def wrapper(value):
+        return dict(cached(value))
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+@_cached_result
 def validate_letterboxd_url(url):
     """
     validates a letterboxd profile URL
@@ -37,6 +67,14 @@ def validate_letterboxd_url(url):
     if not url.startswith(("http://", "https://")):
         url = "https://" + url
 
+    # a plain profile URL is settled by one match; anything else is parsed for
+    # its username or a precise error
+    match = LETTERBOXD_URL_PATTERN.match(url)
+    if match:
+        result["valid"] = True
+        result["username"] = match.group(1)
+        return result
+
     # parse URL
     try:
         parsed = urllib.parse.urlparse(url)
@@ -70,6 +108,7 @@ def validate_letterboxd_url(url):
     return result
 
 
+@_cached_result
 def validate_username(username):
     """
     validates a letterboxd username
@@ -104,28 +143,47 @@ def validate_username(username):
     return result
 
 
-def check_profile_exists(target_url):
+def _check_profile_over_http(target_url):
     """
-    checks if a letterboxd profile exists and is accessible
-
-    Args:
-        target_url: full URL to profile
+    checks a profile with a plain GET, the header is in the server-rendered HTML
 
     Returns:
-        dict with 'exists', 'status', and 'error' keys
+        result dict for a 200 or 404 answer, or None when a browser has to decide
+        (fast path not installed, network error, rate limit or bot challenge)
     """
+    if not http_fetch_available():
+        return None
+    try:
+        with host_slot(target_url):
+            response = get_http_client().get(target_url)
+    except Exception:
+        return None
+
+    result = {"exists": False, "status": response.status_code, "error": None}
+    if response.status_code == 200:
+        if HTMLParser(response.text).css_first(PROFILE_HEADER_SELECTOR) is not None:
+            result["exists"] = True
+        else:
+            result["error"] = "Page loaded but no profile found"
+        return result
+    if response.status_code == 404:
+        result["error"] = "Profile not found (404)"
+        return result
+    return None
+
+
+def _check_profile_in_browser(target_url, browser, standalone):
+    """checks a profile by loading it in a browser page, see check_profile_exists"""
     result = {"exists": False, "status": None, "error": None}
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+    with scrape_page(browser, standalone) as page:
         try:
-            response = page.goto(target_url, timeout=15000)
+            response = page.goto(target_url, timeout=15000, wait_until=PAGE_LOAD_STATE)
             result["status"] = response.status if response else None
 
             if response and response.status == 200:
                 # check for profile header to confirm it's a real profile
-                profile_header = page.query_selector("section.profile-header")
+                profile_header = page.query_selector(PROFILE_HEADER_SELECTOR)
                 if profile_header:
                     result["exists"] = True
                 else:
@@ -141,8 +199,40 @@ def check_profile_exists(target_url):
 
         except Exception as e:
             result["error"] = str(e)
-        page.close()
-        browser.close()
+
+    return result
+
+
+def check_profile_exists(target_url, use_cache=True, browser=None, standalone=False, render=False):
+    """
+    checks if a letterboxd profile exists and is accessible
+
+    Args:
+        target_url: full URL to profile
+        use_cache: if True, reuses recent answers and falls back to a stale
+            answer when the live check is rate limited or fails
+        browser: browser to open the page in (defaults to this thread's pooled browser)
+        standalone: if True, launch a dedicated browser for this check
+        render: if True, always check in a browser instead of over plain HTTP first
+
+    Returns:
+        dict with 'exists', 'status', and 'error' keys
+    """
+    cache_key = f"profile_exists:{target_url}"
+    cached = cache_get(cache_key, ttl=PROFILE_CHECK_STALE_TTL) if use_cache else None
+    if cached and time.time() - cached["checked_at"] < PROFILE_CHECK_TTL:
+        return cached["result"]
+
+    result = None if render else _check_profile_over_http(target_url)
+    if result is None:
+        result = _check_profile_in_browser(target_url, browser, standalone)
+
+    if use_cache:
+        # only a loaded page or a 404 is a definitive answer worth keeping
+        if result["status"] in (200, 404):
+            cache_set(cache_key, {"checked_at": time.time(), "result": result})
+        elif cached:
+            return cached["result"]
 
     return result
 
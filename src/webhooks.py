@@ -1,24 +1,119 @@
 # ----- WEBHOOK NOTIFICATIONS -----
 
+import os
 import time
 import json
 import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from urllib.request import urlopen, Request
 from urllib.error import URLError
 
+# optional speedup: pip install "bumi[fast]"
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# optional speedup: pip install orjson
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .scrapers import scrape_letterboxd
 
+# notifications are sent by at most this many threads at once, over kept-alive connections
+WEBHOOK_WORKERS = 8
+WEBHOOK_TIMEOUT = 30
+
+# payloads larger than this are stored by the manager's payload sink and the
+# webhook is sent a small reference to them instead (bytes)
+WEBHOOK_MAX_INLINE_BYTES = 512 * 1024
+WEBHOOK_PAYLOAD_DIR = Path.home() / ".bumi_webhooks"
+
+# payloads stored by store_payload_file are deleted once they are this old, so
+# receivers have this long to fetch them (seconds)
+WEBHOOK_PAYLOAD_TTL = 7 * 24 * 3600
+
+# (epoch second, formatted timestamp) of the last notification
+_last_timestamp = (None, "")
+
+
+def _encode(payload):
+    """JSON-encodes a webhook payload to bytes, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload).encode("utf-8")
+
+
+def store_payload_file(event_type, body):
+    """
+    default payload sink: writes an oversized payload to WEBHOOK_PAYLOAD_DIR
+
+    Payloads older than WEBHOOK_PAYLOAD_TTL are deleted on the way.
+
+    Returns:
+        file:// URI of the stored payload
+    """
+    WEBHOOK_PAYLOAD_DIR.mkdir(exist_ok=True)
+    _prune_payload_files()
+    path = WEBHOOK_PAYLOAD_DIR / f"{event_type}_{time.time_ns()}.json"
+    path.write_bytes(body)
+    return path.as_uri()
+
+
+def _prune_payload_files():
+    """deletes stored payloads older than WEBHOOK_PAYLOAD_TTL"""
+    cutoff = time.time() - WEBHOOK_PAYLOAD_TTL
+    with os.scandir(WEBHOOK_PAYLOAD_DIR) as entries:
+        for entry in entries:
+            try:
+                if entry.name.endswith(".json") and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except OSError:
+                pass
+
+
+def _timestamp():
+    """formats the current time for a payload, at most once per second"""
+    global _last_timestamp
+    now = int(time.time())
+    second, formatted = _last_timestamp
+    if second != now:
+        formatted = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        _last_timestamp = (now, formatted)
+    return formatted
+
 
 class WebhookManager:
     """
     manages webhook notifications for scrape job completions
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        workers=WEBHOOK_WORKERS,
+        max_inline_bytes=WEBHOOK_MAX_INLINE_BYTES,
+        payload_sink=store_payload_file,
+    ):
+        """
+        Args:
+            workers: number of notifications sent at the same time
+            max_inline_bytes: largest payload sent as is, see payload_sink
+            payload_sink: function(event_type, body) that stores an oversized
+                payload and returns a URI for it, which is sent instead; webhooks
+                needing the reference are skipped when it raises
+        """
         self.webhooks = {}
+        self.workers = workers
+        self.max_inline_bytes = max_inline_bytes
+        self.payload_sink = payload_sink
         self._lock = threading.Lock()
+        self._executor = None
+        self._client = None
 
-    def register(self, webhook_id, url, events=None, headers=None):
+    def register(self, webhook_id, url, events=None, headers=None, max_bytes=None):
         """
         registers a webhook
 
@@ -27,12 +122,15 @@ class WebhookManager:
             url: URL to POST notifications to
             events: list of event types to notify (default: all)
             headers: optional headers to include in requests
+            max_bytes: largest payload this webhook accepts inline (default: the
+                manager's max_inline_bytes)
         """
         with self._lock:
             self.webhooks[webhook_id] = {
                 "url": url,
                 "events": events or ["scrape_complete", "scrape_error", "batch_complete"],
                 "headers": headers or {},
+                "max_bytes": max_bytes,
                 "active": True,
             }
         return webhook_id
@@ -45,7 +143,7 @@ class WebhookManager:
                 return True
         return False
 
-    def notify(self, event_type, data, async_send=True):
+    def notify(self, event_type, data, async_send=True, only=None):
         """
         sends notification to all registered webhooks
 
@@ -53,10 +151,11 @@ class WebhookManager:
             event_type: type of event
             data: event data to send
             async_send: whether to send asynchronously
+            only: if given, ids of the only webhooks to notify
         """
         payload = {
             "event": event_type,
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": _timestamp(),
             "data": data,
         }
 
@@ -64,21 +163,70 @@ class WebhookManager:
             targets = [
                 (wid, wh)
                 for wid, wh in self.webhooks.items()
-                if wh["active"] and event_type in wh.get("events", [])
+                if wh["active"]
+                and event_type in wh.get("events", [])
+                and (only is None or wid in only)
             ]
+        if not targets:
+            return
+
+        # encoded once, every webhook is sent the same bytes
+        body = _encode(payload)
+        reference = None
+        sink_failed = False
 
         for webhook_id, webhook in targets:
+            webhook_body = body
+            if len(body) > (webhook.get("max_bytes") or self.max_inline_bytes):
+                if reference is None and not sink_failed:
+                    try:
+                        data_ref = self.payload_sink(event_type, body)
+                    except Exception as e:
+                        print(f"Error: Unable to store {event_type} payload: {e}")
+                        sink_failed = True
+                    else:
+                        reference = _encode(
+                            {
+                                "event": event_type,
+                                "timestamp": payload["timestamp"],
+                                "data_ref": data_ref,
+                                "size": len(body),
+                            }
+                        )
+                if sink_failed:
+                    # too large to send inline, so this webhook is skipped
+                    continue
+                webhook_body = reference
             if async_send:
-                thread = threading.Thread(
-                    target=self._send_notification, args=(webhook_id, webhook, payload)
+                self._get_executor().submit(
+                    self._send_notification, webhook_id, webhook, webhook_body
                 )
-                thread.daemon = True
-                thread.start()
             else:
-                self._send_notification(webhook_id, webhook, payload)
+                self._send_notification(webhook_id, webhook, webhook_body)
+
+    def _get_executor(self):
+        """creates the sender threads on first use"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="bumi-webhook"
+                )
+            return self._executor
+
+    def _get_client(self):
+        """creates the shared keep-alive HTTP client on first use, None without httpx"""
+        if httpx is None:
+            return None
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    timeout=WEBHOOK_TIMEOUT,
+                    limits=httpx.Limits(max_keepalive_connections=self.workers),
+                )
+            return self._client
 
-    def _send_notification(self, webhook_id, webhook, payload):
-        """sends a single notification"""
+    def _send_notification(self, webhook_id, webhook, body):
+        """sends a single notification, body is the JSON-encoded payload"""
         try:
             headers = {
                 "Content-Type": "application/json",
@@ -86,21 +234,32 @@ class WebhookManager:
             }
             headers.update(webhook.get("headers", {}))
 
-            json_data = json.dumps(payload).encode("utf-8")
-            request = Request(
-                webhook["url"], data=json_data, headers=headers, method="POST"
-            )
-
-            with urlopen(request, timeout=30) as response:
-                print(
-                    f"Webhook {webhook_id}: sent to {webhook['url']}, status {response.status}"
-                )
+            client = self._get_client()
+            if client is not None:
+                response = client.post(webhook["url"], content=body, headers=headers)
+                status = response.status_code
+            else:
+                request = Request(webhook["url"], data=body, headers=headers, method="POST")
+                with urlopen(request, timeout=WEBHOOK_TIMEOUT) as response:
+                    status = response.status
+            print(f"Webhook {webhook_id}: sent to {webhook['url']}, status {status}")
 
         except URLError as e:
             print(f"Webhook {webhook_id}: failed to send to {webhook['url']}: {e}")
         except Exception as e:
             print(f"Webhook {webhook_id}: error: {e}")
 
+    def close(self):
+        """waits for queued notifications, then stops the sender threads and HTTP client"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
     def list_webhooks(self):
         """returns list of registered webhooks"""
         with self._lock:
@@ -114,7 +273,7 @@ class WebhookManager:
 _webhook_manager = WebhookManager()
 
 
-def register_webhook(url, events=None, webhook_id=None, headers=None):
+def register_webhook(url, events=None, webhook_id=None, headers=None, max_bytes=None):
     """
     registers a webhook for notifications
 
@@ -123,12 +282,14 @@ def register_webhook(url, events=None, webhook_id=None, headers=None):
         events: list of event types (default: all)
         webhook_id: optional custom ID
         headers: optional headers
+        max_bytes: largest payload this webhook accepts inline, larger ones are sent
+            as a reference (see WebhookManager)
 
     Returns:
         webhook ID
     """
     wid = webhook_id or f"webhook_{int(time.time() * 1000)}"
-    return _webhook_manager.register(wid, url, events, headers)
+    return _webhook_manager.register(wid, url, events, headers, max_bytes)
 
 
 def unregister_webhook(webhook_id):
@@ -136,9 +297,9 @@ def unregister_webhook(webhook_id):
     return _webhook_manager.unregister(webhook_id)
 
 
-def notify_webhook(event_type, data):
-    """sends a webhook notification"""
-    _webhook_manager.notify(event_type, data)
+def notify_webhook(event_type, data, only=None):
+    """sends a webhook notification, only to the webhook ids in only if given"""
+    _webhook_manager.notify(event_type, data, only=only)
 
 
 def get_webhook_manager():
@@ -173,6 +334,7 @@ def scrape_with_webhook(target_url, webhook_url=None, paginate=True):
         )
 
         if webhook_url:
+            # only the job's own webhook, the registered ones were notified above
             temp_id = register_webhook(webhook_url, ["scrape_complete"])
             notify_webhook(
                 "scrape_complete",
@@ -181,6 +343,7 @@ def scrape_with_webhook(target_url, webhook_url=None, paginate=True):
                     "target_url": target_url,
                     "success": True,
                 },
+                only={temp_id},
             )
             unregister_webhook(temp_id)
 